@@ -2,7 +2,9 @@
 import argparse
 import base64
 import configparser
+import functools
 import getpass
+import hashlib
 import os
 import sys
 import logging
@@ -18,18 +20,15 @@ import requests  # type: ignore
 import threading
 import queue
 from requests.utils import get_encoding_from_headers
-from readability import Document
 import markdownify
 from langdetect import detect
 import warnings
 import asyncio
-import edge_tts
-from playsound import playsound
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil import parser as date_parser  # type: ignore
 from bs4 import BeautifulSoup, UnicodeDammit
 from html import escape, unescape
-import trafilatura
 import re
 import unicodedata
 import signal
@@ -497,12 +496,21 @@ def _process_fetched_content(
     custom_proxy_override=None,
     llm_provider=None,
     extractor="auto",
+    speech_only=False,
+    need_html=True,
+    need_markdown=True,
 ):
     """
     Convert fetched HTML into normalized title/HTML/Markdown output.
 
     This shared post-fetch pipeline keeps CLI and Surf Web behavior aligned when
     they run with the same fetch-related settings.
+
+    With *speech_only* and no translation requested, the Markdown conversion is
+    skipped and ``speech_text`` carries plain text taken directly from the HTML.
+    Callers that will not use ``cleaned_html`` pass ``need_html=False`` to skip
+    rewriting its links; ``need_markdown=False`` skips the Markdown conversion
+    when no translation needs it as input.
     """
     if not html_content:
         raise ValueError(f"Failed to fetch usable content from {request_url}")
@@ -510,6 +518,9 @@ def _process_fetched_content(
     source_url = _extract_source_url_from_html(html_content, request_url)
     content_base_url = source_url
     direct_markdown_payload = _extract_direct_markdown_payload(html_content)
+    # Speech needs Markdown only as translation input or when the payload is Markdown already.
+    plaintext_speech = speech_only and lang_mode == "raw" and not direct_markdown_payload
+    skip_markdown = (plaintext_speech or not need_markdown) and lang_mode == "raw" and not direct_markdown_payload
 
     if direct_markdown_payload:
         title = direct_markdown_payload.get("title") or "Untitled"
@@ -538,7 +549,10 @@ def _process_fetched_content(
         except Exception as e:
             logger.warning(f"Image OCR failed and was skipped: {e}")
 
-        md_content = ContentProcessor.to_markdown(cleaned_html)
+        if skip_markdown:
+            md_content = ""
+        else:
+            md_content = ContentProcessor.to_markdown(cleaned_html)
 
     social_title = OutputHandler._extract_social_first_sentence_title(html_content, source_url=source_url)
     if social_title:
@@ -617,8 +631,10 @@ def _process_fetched_content(
 
     base_url_for_links = content_base_url or source_url or request_url
     if base_url_for_links:
-        md_content = OutputHandler._convert_markdown_urls_to_absolute(md_content, base_url_for_links)
-        cleaned_html = OutputHandler._convert_urls_to_absolute(cleaned_html, base_url_for_links)
+        if md_content:
+            md_content = OutputHandler._convert_markdown_urls_to_absolute(md_content, base_url_for_links)
+        if need_html:
+            cleaned_html = OutputHandler._convert_urls_to_absolute(cleaned_html, base_url_for_links)
 
     return {
         "title": title,
@@ -633,6 +649,7 @@ def _process_fetched_content(
         "source_url": source_url,
         "content_base_url": content_base_url,
         "html_content": html_content,
+        "speech_text": ContentProcessor.to_plaintext(cleaned_html) if plaintext_speech else None,
     }
 
 
@@ -1256,6 +1273,17 @@ def _ocr_local_image(image_path, args, config):
     return ocr_text, engine_used
 
 
+@functools.lru_cache(maxsize=8)
+def _launch_dir_config_candidate(argv0):
+    """Return the config.ini path beside the launched script, or None."""
+    if not argv0 or argv0 in {"-c", "-m"}:
+        return None
+    executable_path = resolve_user_path(argv0)
+    if executable_path and os.path.isfile(executable_path):
+        return os.path.join(os.path.dirname(executable_path), "config.ini")
+    return None
+
+
 def _get_default_config_path():
     """
     Resolve the default config path.
@@ -1265,12 +1293,9 @@ def _get_default_config_path():
     ~/.config/surf/config.ini when XDG_CONFIG_HOME is unset.
     """
     argv0 = (sys.argv[0] or "").strip() if sys.argv else ""
-    if argv0 and argv0 not in {"-c", "-m"}:
-        executable_path = resolve_user_path(argv0)
-        if executable_path and os.path.isfile(executable_path):
-            local_config = os.path.join(os.path.dirname(executable_path), "config.ini")
-            if os.path.exists(local_config):
-                return local_config
+    local_config = _launch_dir_config_candidate(argv0)
+    if local_config and os.path.exists(local_config):
+        return local_config
 
     xdg_config_home = (os.environ.get("XDG_CONFIG_HOME") or "").strip()
     if xdg_config_home:
@@ -1372,6 +1397,12 @@ class Fetcher:
 
     _HTML_META_CHARSET_RE = re.compile(rb'<meta\s+charset\s*=\s*["\']?([^"\'>\s]+)', re.IGNORECASE)
     _HTML_CONTENT_CHARSET_RE = re.compile(rb'content\s*=\s*["\'][^"\']*charset\s*=\s*([^"\';\s]+)', re.IGNORECASE)
+    # (monotonic timestamp, (req_proxies, pw_proxy)) of the last WinINET registry read.
+    _SYSTEM_PROXY_WIN_CACHE = {}
+    _SYSTEM_PROXY_WIN_CACHE_TTL = 30
+
+    # Containers that indicate a browser-rendered page has its main content in place.
+    _BROWSER_CONTENT_SELECTOR = "article, main, [role=main], #content, .post"
 
     @staticmethod
     def _sniff_html_charset(prefix: bytes):
@@ -1567,7 +1598,22 @@ class Fetcher:
         """
         Get Windows system proxy from WinINET (registry / Internet Settings).
         Returns (req_proxies, pw_proxy) or (None, None).
+
+        The registry lookup is cached for a short time because a single fetch
+        can resolve proxies several times (requests, browser fallback, retries).
         """
+        import time as _time
+
+        now = _time.monotonic()
+        cached = Fetcher._SYSTEM_PROXY_WIN_CACHE.get("proxies")
+        if cached and now - cached[0] < Fetcher._SYSTEM_PROXY_WIN_CACHE_TTL:
+            return cached[1]
+        proxies = Fetcher._read_system_proxy_win()
+        Fetcher._SYSTEM_PROXY_WIN_CACHE["proxies"] = (now, proxies)
+        return proxies
+
+    @staticmethod
+    def _read_system_proxy_win():
         try:
             import winreg
 
@@ -1905,15 +1951,33 @@ class Fetcher:
                             return decoded_text
                     except Exception as retry_error:
                         logger.warning(f"Direct retry after proxy failure failed: {retry_error}. Switching to browser...")
-                        return Fetcher.fetch_with_browser(url, config, proxy_mode_override, custom_proxy_override)
+                        return Fetcher.fetch_with_browser(
+                            url,
+                            config,
+                            proxy_mode_override,
+                            custom_proxy_override,
+                            _resolved_proxies=(req_proxies, pw_proxy),
+                        )
                 logger.warning(f"Requests failed: {e}. Switching to browser...")
 
             if should_use_browser:
                 logger.info("Using browser fallback for dynamic content.")
 
-            browser_result = Fetcher.fetch_with_browser(url, config, proxy_mode_override, custom_proxy_override)
+            browser_result = Fetcher.fetch_with_browser(
+                url,
+                config,
+                proxy_mode_override,
+                custom_proxy_override,
+                _resolved_proxies=(req_proxies, pw_proxy),
+            )
         else:
-            browser_result = Fetcher.fetch_with_browser(url, config, proxy_mode_override, custom_proxy_override)
+            browser_result = Fetcher.fetch_with_browser(
+                url,
+                config,
+                proxy_mode_override,
+                custom_proxy_override,
+                _resolved_proxies=(req_proxies, pw_proxy),
+            )
 
         # Post-browser check: if the browser also returned a bot challenge (e.g.
         # WordPress.com blocks headless Chromium), wait briefly and retry with a
@@ -4735,7 +4799,14 @@ class Fetcher:
         custom_proxy_override=None,
         is_twitter_article=False,
         trusted_host_map=None,
+        _resolved_proxies=None,
     ):
+        """
+        Fetch a page with Playwright.
+
+        _resolved_proxies is the (req_proxies, pw_proxy) pair already resolved by
+        the caller for the same proxy settings, so it is not resolved twice.
+        """
         logger.info("Launching browser...")
         from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
 
@@ -4752,8 +4823,11 @@ class Fetcher:
         if is_twitter_url:
             _, pw_proxy = Fetcher._get_twitter_forced_proxies(config, proxy_mode_override, custom_proxy_override)
             logger.info("Twitter/X URL detected - using preferred proxy settings")
+        elif _resolved_proxies is not None:
+            _, pw_proxy = _resolved_proxies
         else:
-            _, pw_proxy = Fetcher._get_proxies(config, proxy_mode_override, custom_proxy_override)
+            _resolved_proxies = Fetcher._get_proxies(config, proxy_mode_override, custom_proxy_override)
+            _, pw_proxy = _resolved_proxies
 
         if pw_proxy:
             logger.info(f"Playwright Proxy: {pw_proxy}")
@@ -4906,21 +4980,20 @@ class Fetcher:
                                 page.wait_for_timeout(3000)
                                 _zhihu_wait_for_content(page, timeout_ms=15000)
                 else:
+                    # networkidle can stall for the whole timeout on pages with
+                    # analytics beacons; wait for the DOM and then for the main
+                    # content container instead of sleeping a fixed interval.
                     try:
-                        page.goto(url, wait_until="networkidle", timeout=60000)
+                        page.goto(url, wait_until="domcontentloaded", timeout=30000)
                     except PlaywrightTimeoutError as e:
                         logger.warning(
-                            "Browser networkidle wait timed out; retrying with domcontentloaded: %s",
+                            "Browser domcontentloaded wait timed out; using partial page content: %s",
                             e,
                         )
-                        try:
-                            page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                        except PlaywrightTimeoutError as fallback_error:
-                            logger.warning(
-                                "Browser domcontentloaded retry also timed out; using partial page content: %s",
-                                fallback_error,
-                            )
-                    page.wait_for_timeout(2000)
+                    try:
+                        page.wait_for_selector(Fetcher._BROWSER_CONTENT_SELECTOR, timeout=4000)
+                    except PlaywrightTimeoutError:
+                        logger.debug("No main content container appeared; using current page content")
 
                 # Retry page.content() if the page is still mid-navigation
                 for _content_attempt in range(3):
@@ -5022,6 +5095,7 @@ class Fetcher:
                                 custom_proxy_override=custom_proxy_override,
                                 is_twitter_article=is_twitter_article,
                                 trusted_host_map={hostname: trusted_ip},
+                                _resolved_proxies=_resolved_proxies,
                             )
                 logger.error(f"Browser fetch failed: {e}")
                 raise
@@ -8813,6 +8887,37 @@ def _get_handler_for_url(url):
 
 
 class ContentProcessor:
+    _PLAINTEXT_BLOCK_TAGS = (
+        "p", "div", "section", "article", "blockquote", "pre", "li", "tr", "br",
+        "h1", "h2", "h3", "h4", "h5", "h6",
+    )
+    _HTML_TITLE_RE = re.compile(r"<title[^>]*>([^<]*)</title>", re.IGNORECASE)
+    # Same normalization Readability applies to Document.title().
+    _TITLE_ENTITY_REPLACEMENTS = (
+        ("\u2014", "-"),
+        ("\u2013", "-"),
+        ("&mdash;", "-"),
+        ("&ndash;", "-"),
+        ("\u00A0", " "),
+        ("\u00AB", '"'),
+        ("\u00BB", '"'),
+        ("&quot;", '"'),
+    )
+
+    @staticmethod
+    def _extract_raw_title(html):
+        """
+        Equivalent of Document(html).title() via a single regex search, so the
+        fallback paths do not parse the whole raw page again just for its title.
+        """
+        match = ContentProcessor._HTML_TITLE_RE.search(html or "")
+        if not match or not match.group(1):
+            return "[no-title]"
+        title = " ".join(unescape(match.group(1)).split())
+        for entity, replacement in ContentProcessor._TITLE_ENTITY_REPLACEMENTS:
+            title = title.replace(entity, replacement)
+        return title
+
     @staticmethod
     def _text_appears_to_match_target_language(text, target_lang):
         """Heuristic guard for mixed Markdown where langdetect sees badges/URLs first."""
@@ -8969,7 +9074,7 @@ class ContentProcessor:
         # raw mode: skip extraction entirely
         if extractor == "raw":
             logger.info("Raw mode: skipping content extraction")
-            return Document(html).title(), html
+            return ContentProcessor._extract_raw_title(html), html
 
         # Site-specific HTML that is already normalized should bypass Readability.
         # Xiaohongshu note pages are especially fragile here: short text + image galleries
@@ -8983,24 +9088,32 @@ class ContentProcessor:
             logger.info(
                 f"Bypassing Readability for {source_site}. Preserved HTML length: {len(preserved_html)}, images: {img_count}"
             )
-            return Document(str(preprocessed_soup)).title(), preserved_html
+            return ContentProcessor._extract_raw_title(html), preserved_html
+
+        # Serialize the preprocessed tree once; Readability and the Trafilatura
+        # fallback both consume the same markup.
+        preprocessed_html = str(preprocessed_soup)
 
         # trafilatura-only mode
         if extractor == "trafilatura":
             try:
-                content_html = trafilatura.extract(str(preprocessed_soup), output_format="html", include_images=True)
+                import trafilatura
+
+                content_html = trafilatura.extract(preprocessed_html, output_format="html", include_images=True)
                 if content_html:
                     img_count = content_html.count("<img")
                     logger.info(f"Trafilatura extracted {img_count} images. Content length: {len(content_html)}")
-                    return Document(html).title(), content_html
+                    return ContentProcessor._extract_raw_title(html), content_html
             except Exception as e:
                 logger.warning(f"Trafilatura extraction failed: {e}")
             logger.warning("Trafilatura extraction failed, returning original HTML")
-            return Document(html).title(), html
+            return ContentProcessor._extract_raw_title(html), html
 
         # 1. Get Readability Summary (default and readability-only modes)
         try:
-            doc = Document(str(preprocessed_soup))
+            from readability import Document
+
+            doc = Document(preprocessed_html)
             title = doc.title()
             summary_html = doc.summary()
             logger.info(f"Readability title: {title}")
@@ -9020,22 +9133,44 @@ class ContentProcessor:
         except Exception as e:
             if extractor == "readability":
                 logger.warning(f"Readability extraction failed: {e}. Returning original HTML.")
-                return Document(html).title(), html
+                return ContentProcessor._extract_raw_title(html), html
             logger.warning(f"Readability/Rescue failed: {e}. Falling back to Trafilatura.")
 
         # Final Fallback: Trafilatura
         try:
-            content_html = trafilatura.extract(str(preprocessed_soup), output_format="html", include_images=True)
+            import trafilatura
+
+            content_html = trafilatura.extract(preprocessed_html, output_format="html", include_images=True)
             if content_html:
                 img_count = content_html.count("<img")
                 logger.info(f"Trafilatura extracted {img_count} images. Content length: {len(content_html)}")
                 logger.info(f"Trafilatura content preview: {content_html[:200]}")
-                return Document(html).title(), content_html
+                return ContentProcessor._extract_raw_title(html), content_html
         except Exception as e:
             logger.warning(f"Trafilatura extraction failed: {e}")
 
         logger.warning("All extraction methods failed, returning original HTML")
-        return Document(html).title(), html
+        return ContentProcessor._extract_raw_title(html), html
+
+    @staticmethod
+    def to_plaintext(html):
+        """
+        Converts extracted HTML straight to plain text for speech synthesis.
+
+        A single lxml tree walk; block-level elements are separated by newlines so
+        TTS still pauses between paragraphs.
+        """
+        import lxml.html
+
+        if not html or not html.strip():
+            return ""
+        root = lxml.html.fromstring(html)
+        for element in root.xpath("//script|//style|//noscript|//img|//svg"):
+            element.drop_tree()
+        for element in root.iter(*ContentProcessor._PLAINTEXT_BLOCK_TAGS):
+            element.tail = "\n" + (element.tail or "")
+        text = root.text_content()
+        return re.sub(r"\n\s*\n+", "\n\n", text).strip()
 
     @staticmethod
     def to_markdown(html):
@@ -9053,30 +9188,106 @@ class ContentProcessor:
     def _chunk_text(text, max_chars=4000):
         """
         Splits text into chunks by paragraphs, attempting to stay under max_chars.
+
+        Paragraph boundaries are located in place and each chunk is sliced from
+        the original text, so large documents are not split into one string per
+        paragraph first.
         """
         chunks = []
-        current_chunk = []
+        chunk_start = 0
+        chunk_end = None
         current_len = 0
 
-        # Split by double newlines to preserve paragraphs
-        paragraphs = text.split("\n\n")
-
-        for paragraph in paragraphs:
-            para_len = len(paragraph)
+        # Walk double-newline paragraph boundaries to preserve paragraphs
+        para_start = 0
+        while True:
+            para_end = text.find("\n\n", para_start)
+            if para_end < 0:
+                para_end = len(text)
+            para_len = para_end - para_start
             # If a single paragraph is huge, we might still overshoot, but this is a simple heuristic.
-            if current_len + para_len + 2 > max_chars and current_chunk:
-                chunks.append("\n\n".join(current_chunk))
-                current_chunk = []
+            if current_len + para_len + 2 > max_chars and chunk_end is not None:
+                chunks.append(text[chunk_start:chunk_end])
+                chunk_start = para_start
                 current_len = 0
 
-            current_chunk.append(paragraph)
+            chunk_end = para_end
             current_len += para_len + 2
+            if para_end == len(text):
+                break
+            para_start = para_end + 2
 
-        if current_chunk:
-            chunks.append("\n\n".join(current_chunk))
+        chunks.append(text[chunk_start:chunk_end])
 
         return chunks
 
+    @staticmethod
+    def _get_translation_concurrency(config, total_chunks):
+        """Number of chunks to translate in parallel, from [LLM] translate_concurrency."""
+        try:
+            concurrency = int(config.get("LLM", "translate_concurrency", fallback="4"))
+        except (TypeError, ValueError):
+            concurrency = 4
+        return max(1, min(concurrency, total_chunks))
+
+    @staticmethod
+    def _translation_cache_path(config, llm_config, text, title, target_lang):
+        """Return the on-disk cache file for a translation, or None when caching is off."""
+        enabled = str(config.get("LLM", "translation_cache", fallback="true")).strip().lower()
+        if enabled in {"0", "false", "no", "off"}:
+            return None
+        cache_home = (os.environ.get("XDG_CACHE_HOME") or "").strip() or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        key_source = json.dumps(
+            [llm_config.get("base_url"), llm_config.get("model"), target_lang, title or "", text],
+            ensure_ascii=False,
+        )
+        digest = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(cache_home, "surf", "translations", f"{digest}.json")
+
+    @staticmethod
+    def _read_translation_cache(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            return cached["text"], cached.get("title")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _write_translation_cache(cache_path, text, title):
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"text": text, "title": title}, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write translation cache {cache_path}: {e}")
+
+    @staticmethod
+    def _create_translation_http_client(max_connections):
+        """
+        Build the pooled httpx client shared by all requests of one translation.
+
+        Keep-alive lets every chunk reuse the same TLS connection; HTTP/2 is used
+        to multiplex the chunks when the optional h2 package is installed.
+        """
+        import httpx
+
+        client_kwargs = {
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            "timeout": httpx.Timeout(600.0, connect=10.0),
+        }
+        try:
+            return httpx.Client(http2=True, **client_kwargs)
+        except ImportError:
+            return httpx.Client(**client_kwargs)
+
     @classmethod
     def translate_if_needed(cls, text, title=None, target_lang="zh-cn", config=None, llm_provider=None):
         """
@@ -9124,11 +9335,25 @@ class ContentProcessor:
                 logger.error(f"LLM configuration error: {e}")
                 return text, title
 
-            client = OpenAI(base_url=llm_config["base_url"], api_key=llm_config["api_key"])
+            cache_path = cls._translation_cache_path(config, llm_config, text, title, target_lang)
+            cached = cls._read_translation_cache(cache_path) if cache_path else None
+            if cached:
+                logger.info("Using cached translation.")
+                return cached
 
-            # 1. Translate Title (if provided)
-            translated_title = title
-            if title:
+            # The title and content chunks are translated in parallel over one
+            # pooled connection, so the title request overlaps the chunks.
+            chunks = cls._chunk_text(text)
+            total_chunks = len(chunks)
+            concurrency = cls._get_translation_concurrency(config, total_chunks + (1 if title else 0))
+            http_client = cls._create_translation_http_client(concurrency)
+            client = OpenAI(
+                base_url=llm_config["base_url"],
+                api_key=llm_config["api_key"],
+                http_client=http_client,
+            )
+
+            def _translate_title():
                 logger.info("Translating title...")
                 try:
                     t_completion = client.chat.completions.create(
@@ -9141,19 +9366,20 @@ class ContentProcessor:
                             {"role": "user", "content": title},
                         ],
                     )
-                    translated_title = t_completion.choices[0].message.content.strip()
-                    logger.info(f"Translated title: {translated_title}")
+                    translated = t_completion.choices[0].message.content.strip()
+                    logger.info(f"Translated title: {translated}")
+                    return translated, False
                 except Exception as e:
                     logger.error(f"Title translation failed: {e}")
+                    return title, True
 
-            # 2. Translate Content (Chunked)
-            chunks = cls._chunk_text(text)
-            translated_chunks = []
-
-            total_chunks = len(chunks)
-            logger.info(f"Content split into {total_chunks} chunks for translation.")
+            logger.info(
+                f"Content split into {total_chunks} chunks for translation "
+                f"({concurrency} in parallel)."
+            )
 
-            for i, chunk in enumerate(chunks):
+            def _translate_chunk(indexed_chunk):
+                i, chunk = indexed_chunk
                 logger.info(f"Translating chunk {i + 1}/{total_chunks} ({len(chunk)} chars)...")
                 completion = client.chat.completions.create(
                     model=llm_config["model"],
@@ -9168,9 +9394,17 @@ class ContentProcessor:
                         {"role": "user", "content": chunk},
                     ],
                 )
-                translated_chunks.append(completion.choices[0].message.content)
+                return completion.choices[0].message.content
+
+            with http_client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+                title_future = executor.submit(_translate_title) if title else None
+                translated_chunks = list(executor.map(_translate_chunk, enumerate(chunks)))
+                translated_title, title_failed = title_future.result() if title_future else (title, False)
 
-            return "\n\n".join(translated_chunks), translated_title
+            translated_text = "\n\n".join(translated_chunks)
+            if cache_path and not title_failed:
+                cls._write_translation_cache(cache_path, translated_text, translated_title)
+            return translated_text, translated_title
 
         except Exception as e:
             logger.error(f"Translation failed: {e}")
@@ -9580,6 +9814,65 @@ class OcrHandler:
 
 class OutputHandler:
     _MOJIBAKE_CHARS = "ÃÂâäåæçèéêëïðñøùœž€™�"
+    _MD_IMAGE_RE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
+    _MD_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+    _MD_INLINE_TAG_RE = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)\s+[^>]*>")
+    # URL-bearing attributes rewritten in inline HTML inside Markdown.
+    _MD_INLINE_URL_ATTRS = {
+        "img": ["src", "data-src", "data-srcset", "srcset"],
+        "video": ["src", "poster", "data-src"],
+        "audio": ["src", "data-src"],
+        "source": ["src", "srcset"],
+        "track": ["src"],
+        "embed": ["src"],
+        "object": ["data"],
+        "iframe": ["src"],
+        "svg": ["data", "href"],
+        "script": ["src", "href"],
+        "a": ["href"],
+        "link": ["href"],
+    }
+    # URL-bearing attributes rewritten in saved HTML.
+    _HTML_URL_ATTRS = {
+        # 媒体和图片
+        "img": ["src", "data-src", "data-srcset", "srcset"],
+        "video": ["src", "poster", "data-src"],
+        "audio": ["src", "data-src"],
+        "source": ["src", "srcset"],
+        "track": ["src"],
+        "embed": ["src"],
+        "object": ["data"],
+        "iframe": ["src"],
+        "svg": ["data", "href"],  # SVG引用
+        # 链接和导航
+        "a": ["href"],
+        "area": ["href"],
+        "base": ["href"],
+        "link": ["href"],  # stylesheet, favicon等
+        # 脚本和样式
+        "script": ["src", "href"],
+        "style": ["href"],
+        # 表单
+        "form": ["action"],
+        "input": ["src"],
+        "button": ["formaction"],
+        # 其他
+        "ins": ["cite"],
+        "del": ["cite"],
+        "blockquote": ["cite"],
+    }
+    _NON_RELATIVE_URL_PREFIXES = ("http://", "https://", "data:", "#", "mailto:", "tel:", "javascript:")
+    # Anything other than letters, digits, space, dot, underscore and hyphen.
+    _UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w .-]")
+    # Characters that are invalid in Windows path segments.
+    _INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*\x00-\x1F]')
+    _WHITESPACE_RUN_RE = re.compile(r"\s+")
+    # Reserved DOS device names.
+    _RESERVED_FILENAMES = frozenset(
+        ["CON", "PRN", "AUX", "NUL"]
+        + [f"COM{i}" for i in range(1, 10)]
+        + [f"LPT{i}" for i in range(1, 10)]
+    )
 
     @staticmethod
     def _mojibake_score(text):
@@ -9647,45 +9940,24 @@ class OutputHandler:
 
     @staticmethod
     def _sanitize_filename(filename):
-        return "".join([c for c in filename if c.alpha() or c.isdigit() or c in " ._-"]).rstrip()
+        return OutputHandler._UNSAFE_FILENAME_CHARS_RE.sub("", filename).rstrip()
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _safe_filename_title(title, max_len=None):
+        # Cached: a save derives the same title's filename several times
+        # (default stem, output path, per-format save).
         raw_title = str(title or "")
         # Keep all filename-safe punctuation (including CJK punctuation);
         # remove only characters that are invalid on Windows filesystems.
-        safe_title = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "", raw_title)
+        safe_title = OutputHandler._INVALID_FILENAME_CHARS_RE.sub("", raw_title)
         # Windows does not allow trailing space/dot in path segments.
         safe_title = safe_title.strip().rstrip(". ")
         # Normalize whitespace while preserving punctuation.
-        safe_title = re.sub(r"\s+", " ", safe_title)
+        safe_title = OutputHandler._WHITESPACE_RUN_RE.sub(" ", safe_title)
 
         # Avoid reserved DOS device names.
-        reserved = {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        }
-        if safe_title.upper() in reserved:
+        if safe_title.upper() in OutputHandler._RESERVED_FILENAMES:
             safe_title = f"{safe_title}_"
         if max_len:
             safe_title = safe_title[:max_len]
@@ -9952,54 +10224,14 @@ class OutputHandler:
 
         soup = BeautifulSoup(html_content, "html.parser")
 
-        # 需要处理的标签和属性映射
-        tag_attr_map = {
-            # 媒体和图片
-            "img": ["src", "data-src", "data-srcset", "srcset"],
-            "video": ["src", "poster", "data-src"],
-            "audio": ["src", "data-src"],
-            "source": ["src", "srcset"],
-            "track": ["src"],
-            "embed": ["src"],
-            "object": ["data"],
-            "iframe": ["src"],
-            "svg": ["data", "href"],  # SVG引用
-            # 链接和导航
-            "a": ["href"],
-            "area": ["href"],
-            "base": ["href"],
-            "link": ["href"],  # stylesheet, favicon等
-            # 脚本和样式
-            "script": ["src", "href"],
-            "style": ["href"],
-            # 表单
-            "form": ["action"],
-            "input": ["src"],
-            "button": ["formaction"],
-            # 其他
-            "ins": ["cite"],
-            "del": ["cite"],
-            "blockquote": ["cite"],
-        }
-
-        for tag, attrs in tag_attr_map.items():
-            for element in soup.find_all(tag):
-                for attr in attrs:
-                    url = element.get(attr)
-                    if url and not url.startswith(
-                        (
-                            "http://",
-                            "https://",
-                            "data:",
-                            "#",
-                            "mailto:",
-                            "tel:",
-                            "javascript:",
-                        )
-                    ):
-                        absolute_url = urljoin(base_url, url)
-                        element[attr] = absolute_url
-                        logger.debug(f"Converted relative URL: {url} -> {absolute_url}")
+        # One pass over every tag that can carry a URL attribute.
+        for element in soup.find_all(list(OutputHandler._HTML_URL_ATTRS)):
+            for attr in OutputHandler._HTML_URL_ATTRS[element.name]:
+                url = element.get(attr)
+                if url and not url.startswith(OutputHandler._NON_RELATIVE_URL_PREFIXES):
+                    absolute_url = urljoin(base_url, url)
+                    element[attr] = absolute_url
+                    logger.debug(f"Converted relative URL: {url} -> {absolute_url}")
 
         return str(soup)
 
@@ -10110,7 +10342,7 @@ class OutputHandler:
                 return f"![{alt_text}]({absolute_url})"
             return match.group(0)
 
-        md_content = re.sub(r"!\[([^\]]*)\]\(([^)]+)\)", replace_image_url, md_content)
+        md_content = OutputHandler._MD_IMAGE_RE.sub(replace_image_url, md_content)
 
         # 处理链接: [text](url)
         def replace_link_url(match):
@@ -10125,30 +10357,19 @@ class OutputHandler:
                 return f"[{text}]({absolute_url})"
             return match.group(0)
 
-        md_content = re.sub(r"\[([^\]]*)\]\(([^)]+)\)", replace_link_url, md_content)
+        md_content = OutputHandler._MD_LINK_RE.sub(replace_link_url, md_content)
 
         # 处理内联HTML标签中的URL（如 <video src="...">、<audio src="..."> 等）
         def convert_html_attrs_in_md(match):
+            # Only tags that can carry a URL are worth parsing.
+            if match.group(1).lower() not in OutputHandler._MD_INLINE_URL_ATTRS:
+                return match.group(0)
             html_tag = match.group(0)
             soup = BeautifulSoup(html_tag, "html.parser")
             tag = soup.find()
 
             if tag:
-                tag_attr_map = {
-                    "img": ["src", "data-src", "data-srcset", "srcset"],
-                    "video": ["src", "poster", "data-src"],
-                    "audio": ["src", "data-src"],
-                    "source": ["src", "srcset"],
-                    "track": ["src"],
-                    "embed": ["src"],
-                    "object": ["data"],
-                    "iframe": ["src"],
-                    "svg": ["data", "href"],
-                    "script": ["src", "href"],
-                    "a": ["href"],
-                    "link": ["href"],
-                }
-
+                tag_attr_map = OutputHandler._MD_INLINE_URL_ATTRS
                 tag_name = tag.name
                 if tag_name in tag_attr_map:
                     for attr in tag_attr_map[tag_name]:
@@ -10168,7 +10389,7 @@ class OutputHandler:
             return str(soup)
 
         # 匹配自闭合标签如 <img src="...">、<video src="..."> 等
-        md_content = re.sub(r"<([a-zA-Z][a-zA-Z0-9]*)\s+[^>]*>", convert_html_attrs_in_md, md_content)
+        md_content = OutputHandler._MD_INLINE_TAG_RE.sub(convert_html_attrs_in_md, md_content)
 
         return md_content
 
@@ -11398,6 +11619,13 @@ print(json.dumps(cookies, ensure_ascii=False))
 
 
 class TTSHandler:
+    # Players that accept an MP3 stream on stdin, so playback can start while
+    # synthesis is still running.
+    _STREAMING_PLAYERS = (
+        ("mpv", ("--no-video", "--really-quiet", "-")),
+        ("ffplay", ("-nodisp", "-autoexit", "-loglevel", "quiet", "-")),
+    )
+
     @staticmethod
     async def generate_speech(text, output_file, config):
         voice = config.get("TTS", "voice", fallback="zh-CN-XiaoxiaoNeural")
@@ -11405,43 +11633,159 @@ class TTSHandler:
         volume = config.get("TTS", "volume", fallback="+0%")
 
         logger.info(f"Generating TTS audio with voice: {voice}, rate: {rate}, volume: {volume}...")
+        import edge_tts
+
         communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume)
         await communicate.save(output_file)
         logger.info(f"Audio saved to {output_file}")
 
+    @staticmethod
+    async def generate_and_stream_speech(text, output_file, config, player_command):
+        """Synthesize speech once and tee the MP3 stream into a file and a player.
+
+        Returns False, before synthesizing anything, when the player cannot be
+        started. If synthesis fails the player is stopped and the partial
+        *output_file* is removed before the error propagates.
+        """
+        voice = config.get("TTS", "voice", fallback="zh-CN-XiaoxiaoNeural")
+        rate = config.get("TTS", "rate", fallback="+0%")
+        volume = config.get("TTS", "volume", fallback="+0%")
+
+        audio_file = open(output_file, "wb") if output_file else None
+        try:
+            player = subprocess.Popen(
+                player_command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.warning(f"Could not start audio player {player_command[0]}: {e}")
+            if audio_file:
+                audio_file.close()
+            return False
+
+        logger.info(f"Streaming TTS audio with voice: {voice}, rate: {rate}, volume: {volume}...")
+        audio_queue = queue.Queue()
+
+        def _feed_player():
+            # Keep draining the queue after a write failure so synthesis never blocks.
+            player_alive = True
+            while True:
+                data = audio_queue.get()
+                if data is None:
+                    break
+                if not player_alive:
+                    continue
+                try:
+                    player.stdin.write(data)
+                    player.stdin.flush()
+                except (BrokenPipeError, OSError):
+                    player_alive = False
+            try:
+                player.stdin.close()
+            except OSError:
+                pass
+
+        feeder = threading.Thread(target=_feed_player, daemon=True)
+        feeder.start()
+        completed = False
+        try:
+            import edge_tts
+
+            communicate = edge_tts.Communicate(text, voice, rate=rate, volume=volume)
+            async for chunk in communicate.stream():
+                if chunk["type"] != "audio":
+                    continue
+                if audio_file:
+                    audio_file.write(chunk["data"])
+                audio_queue.put(chunk["data"])
+            completed = True
+        finally:
+            if audio_file:
+                audio_file.close()
+            if not completed:
+                # Stop the player first so the feeder's pending writes fail fast.
+                player.kill()
+            audio_queue.put(None)
+            feeder.join()
+            if not completed:
+                player.wait()
+                if output_file and os.path.exists(output_file):
+                    os.remove(output_file)
+
+        if output_file:
+            logger.info(f"Audio saved to {output_file}")
+        player.wait()
+        logger.info("Playback finished.")
+        return True
+
+    @staticmethod
+    def _find_streaming_player():
+        """Return a command line for a player that can decode MP3 from stdin, if any."""
+        for name, player_args in TTSHandler._STREAMING_PLAYERS:
+            executable = shutil.which(name)
+            if executable:
+                return [executable, *player_args]
+        return None
+
     @staticmethod
     def play_audio(file_path):
         logger.info(f"Playing audio: {file_path}")
+        from playsound import playsound
+
         # playsound handles the blocking playback
         playsound(file_path)
         logger.info("Playback finished.")
 
     @staticmethod
-    def run_tts(title, content, config, speak=False, save_path=None):
-        # Professional cleanup for TTS: remove markdown artifacts, images, and only keep link text
-        # Remove ![alt](url)
-        clean_text = re.sub(r"!\[.*?\]\(.*?\)", "", content)
-        # Remove [link text](url) -> keep 'link text'
-        clean_text = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", clean_text)
-        # Remove other common MD artifacts
-        clean_text = clean_text.replace("#", "").replace("*", "").replace("`", "").replace("---", "")
+    def run_tts(title, content, config, speak=False, save_path=None, is_plaintext=False):
+        """Speak and/or save *content* as audio.
+
+        Returns the path of the audio file left on disk, or None when nothing
+        was kept (speak-only playback) or generation failed.
+        """
+        if is_plaintext:
+            # Already plain text (ContentProcessor.to_plaintext); no Markdown to strip.
+            clean_text = content
+        else:
+            # Professional cleanup for TTS: remove markdown artifacts, images, and only keep link text
+            # Remove ![alt](url)
+            clean_text = re.sub(r"!\[.*?\]\(.*?\)", "", content)
+            # Remove [link text](url) -> keep 'link text'
+            clean_text = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", clean_text)
+            # Remove other common MD artifacts
+            clean_text = clean_text.replace("#", "").replace("*", "").replace("`", "").replace("---", "")
 
         # If output file not specified but speak is needed, use temp
         temp_file = "tts_temp.mp3"
         filename = resolve_user_path(save_path) if save_path else temp_file
 
         try:
+            player_command = TTSHandler._find_streaming_player() if speak else None
+            # Stream straight into the player; only touch disk when saving.
+            # Without a usable player, fall back to saving and then playing.
+            output_file = filename if save_path else None
+            if player_command and asyncio.run(
+                TTSHandler.generate_and_stream_speech(clean_text, output_file, config, player_command)
+            ):
+                return output_file
+
             asyncio.run(TTSHandler.generate_speech(clean_text, filename, config))
 
             if speak:
                 TTSHandler.play_audio(filename)
 
             # If we used a temp file and didn't ask to save, clean it up
-            if speak and not save_path and os.path.exists(temp_file):
-                os.remove(temp_file)
+            if speak and not save_path:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                return None
+            return filename
 
         except Exception as e:
             logger.error(f"TTS operation failed: {e}")
+            return None
 
 
 def main():
@@ -11980,6 +12324,9 @@ Twitter/X Backend:
             custom_proxy_override=custom_proxy,
             llm_provider=args.llm if hasattr(args, "llm") else None,
             extractor=args.extractor,
+            speech_only=output_format == "audio" or (output_format == "md" and args.speak),
+            need_html=output_format == "html",
+            need_markdown=output_format != "html",
         )
     except Exception as e:
         logger.error(f"Failed to process fetched content: {e}")
@@ -11995,6 +12342,7 @@ Twitter/X Backend:
     translated_title = processed["translated_title"]
     translated_description = processed["translated_description"]
     translation_performed = processed["translation_performed"]
+    speech_text = processed.get("speech_text")
 
     # 5. Output
     # Use the source URL from meta tag if available (for xhslink resolution)
@@ -12022,10 +12370,14 @@ Twitter/X Backend:
             OutputHandler.save_html(title, cleaned_html, config, inline=args.html_inline)
 
     elif output_format == "audio":
+        tts_content = speech_text if speech_text is not None else md_content
+        is_plaintext = speech_text is not None
         if output_path:
-            TTSHandler.run_tts(title, md_content, config, speak=args.speak, save_path=output_path)
+            TTSHandler.run_tts(
+                title, tts_content, config, speak=args.speak, save_path=output_path, is_plaintext=is_plaintext
+            )
         else:
-            TTSHandler.run_tts(title, md_content, config, speak=args.speak)
+            TTSHandler.run_tts(title, tts_content, config, speak=args.speak, is_plaintext=is_plaintext)
 
     elif output_format == "publish":
         # Publish to pastebin (md content without YAML front matter)
@@ -12070,7 +12422,10 @@ Twitter/X Backend:
             )
 
         if args.speak:
-            TTSHandler.run_tts(title, md_content, config, speak=True)
+            if speech_text is not None:
+                TTSHandler.run_tts(title, speech_text, config, speak=True, is_plaintext=True)
+            else:
+                TTSHandler.run_tts(title, md_content, config, speak=True)
         elif output_path == "-":
             # Output to stdout
             _configure_stdout_utf8()
@@ -4,6 +4,7 @@ Surf Web Interface - A web interface for the Surf URL to Markdown/PDF converter.
 
 Usage:
     python surf_web.py [--host HOST] [--port PORT] [--root ROOT]
+                       [--workers N] [--threads N] [--dev] [--no-browser]
 
 Example:
     python surf_web.py --host 0.0.0.0 --port 8080
@@ -12,15 +13,22 @@ Example:
 
 import argparse
 import copy
+import gzip
+import hashlib
 import importlib.util
+import json
 import os
+import queue
 import re
+import socket
 import sys
 import threading
 import time
-import traceback
 import uuid
 import webbrowser
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from html import escape
 from types import SimpleNamespace
 
@@ -28,23 +36,17 @@ from types import SimpleNamespace
 try:
     from flask import (
         Flask,
-        render_template_string,
+        Response,
         request,
         jsonify,
-        send_file,
-    )
-    from werkzeug.exceptions import HTTPException
-except ImportError:
-    print("Flask not installed. Installing...")
-    os.system("pip install flask")
-    from flask import (
-        Flask,
-        render_template_string,
-        request,
-        jsonify,
-        send_file,
+        send_from_directory,
     )
+    from flask.json.provider import DefaultJSONProvider
     from werkzeug.exceptions import HTTPException
+except ImportError as exc:
+    raise ModuleNotFoundError(
+        "Surf Web requires Flask. Install the project dependencies with `uv sync` or `pip install flask`."
+    ) from exc
 
 def _ensure_local_surf_module():
     """Make surf_web import the sibling surf.py even when an older surf is installed."""
@@ -74,6 +76,8 @@ from surf import (
     OutputHandler,
     TTSHandler,
     _convert_embedded_html_in_markdown,
+    _extract_source_url_from_html,
+    _get_default_config_path,
     _get_handler_for_url,
     _get_version,
     logger,
@@ -84,6 +88,9 @@ from surf import (
 _ROOT_PATH = os.environ.get("SURF_ROOT_PATH", "").rstrip("/")
 
 app = Flask(__name__)
+# Let a front server (Apache mod_xsendfile, lighttpd) stream downloads
+# itself instead of passing the bytes through Python.
+app.use_x_sendfile = os.environ.get("SURF_X_SENDFILE") == "1"
 
 class _PrefixStripper:
     """WSGI middleware that strips a URL prefix so Flask routes work behind a reverse proxy."""
@@ -103,6 +110,66 @@ _TRANSLATION_JOBS = {}
 _TRANSLATION_JOBS_LOCK = threading.Lock()
 _SAVE_JOBS = {}
 _SAVE_JOBS_LOCK = threading.Lock()
+# Finished translation/save jobs are kept this long for status polls.
+_JOB_RETENTION_SECONDS = 3600
+# Shared pool for background save jobs so request threads return quickly and
+# job threads are reused.
+_WEB_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="surf-web")
+# Translation jobs get their own pool: save jobs wait on them, so they must
+# never queue behind the saves occupying _WEB_EXECUTOR.
+_TRANSLATION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="surf-web-translate")
+# Separate pool for short side requests that a request or job waits on, so
+# they never queue behind the jobs running in _WEB_EXECUTOR.
+_WEB_IO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="surf-web-io")
+# Recent /api/process results keyed by the submitted options. Entries hold
+# the full page HTML, so keep the cache small and short-lived.
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+_RESULT_CACHE_MAX_ENTRIES = 32
+_RESULT_CACHE_TTL = 600
+_PROCESS_STREAM_FLUSH_SECONDS = 0.05
+_PROCESS_STREAM_HEARTBEAT_SECONDS = 15
+# Recently fetched pages keyed by URL and fetch options, so re-running a page
+# with another language or output option skips the network round trip.
+_FETCH_CACHE = OrderedDict()
+_FETCH_CACHE_LOCK = threading.Lock()
+_FETCH_CACHE_MAX_ENTRIES = 16
+_FETCH_CACHE_TTL = 600
+# Fetches currently running, keyed like _FETCH_CACHE, so duplicate requests
+# that arrive together share one fetch.
+_FETCH_IN_FLIGHT = {}
+# Fetched page HTML and finished results kept server-side for later saves;
+# the browser holds only tokens, so pages are not shipped to it and posted back.
+# A result refers to its page HTML by token instead of holding a copy, and the
+# stash is bounded by total string size as well as entry count.
+_SAVE_STASH = OrderedDict()
+_SAVE_STASH_LOCK = threading.Lock()
+_SAVE_STASH_MAX_ENTRIES = 64
+_SAVE_STASH_MAX_BYTES = 32 * 1024 * 1024
+_SAVE_STASH_TTL = 3600
+_SAVE_EXPIRED_ERROR = "待保存的结果已过期，请重新处理后再保存"
+# Cap concurrent page fetches per process; headless browser renders are
+# memory-heavy, so they get a much smaller budget than plain HTTP fetches.
+_BROWSER_FETCH_SLOTS = threading.BoundedSemaphore(int(os.environ.get("SURF_BROWSER_CONCURRENCY", "2")))
+_HTTP_FETCH_CONCURRENCY = int(os.environ.get("SURF_FETCH_CONCURRENCY", "16"))
+_HTTP_FETCH_SLOTS = threading.BoundedSemaphore(_HTTP_FETCH_CONCURRENCY)
+_FETCH_SLOT_TIMEOUT = 30
+_RETRY_AFTER_SECONDS = 10
+# /api/process work (fetch, extract, convert) runs here so the request thread
+# can give up after the processing timeout instead of hanging on a bad URL.
+# Conversions mostly wait on remote hosts, so by default the pool is as large
+# as the plain-fetch budget rather than capping concurrency below it.
+_PROCESS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("SURF_PROCESS_CONCURRENCY") or _HTTP_FETCH_CONCURRENCY),
+    thread_name_prefix="surf-web-process",
+)
+_PROCESS_TIMEOUT_SECONDS = float(os.environ.get("SURF_PROCESS_TIMEOUT", "180"))
+# basename -> absolute path of files written by the save endpoints, so
+# /download/<filename> can find them without probing directories.
+_FILE_INDEX = {}
+# Output directory -> its mtime at the last index scan, so a download miss only
+# rescans directories that changed since.
+_FILE_INDEX_SCANS = {}
 
 
 def _apply_root_path():
@@ -116,10 +183,56 @@ def _apply_root_path():
 _apply_root_path()
 
 
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, falling back for types it rejects."""
+
+    def __init__(self, flask_app, orjson_module):
+        super().__init__(flask_app)
+        self._orjson = orjson_module
+
+    def dumps(self, obj, **kwargs):
+        try:
+            return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return self._orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Build the body as bytes directly instead of decoding orjson's output
+        # to str for the base class to encode again.
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        option = self._orjson.OPT_NON_STR_KEYS | self._orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= self._orjson.OPT_INDENT_2
+        try:
+            body = self._orjson.dumps(obj, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def _install_json_provider():
+    """Serialize API responses with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return
+    app.json = _OrjsonProvider(app, orjson)
+
+
+_install_json_provider()
+
+
 @app.errorhandler(Exception)
 def handle_api_error(error):
     """Return JSON errors for API routes instead of Flask HTML error pages."""
     if not request.path.startswith("/api/"):
+        if isinstance(error, HTTPException):
+            return error
         raise error
 
     if isinstance(error, HTTPException):
@@ -129,6 +242,30 @@ def handle_api_error(error):
     logger.exception("Unhandled API error")
     return jsonify({"success": False, "error": str(error)}), 500
 
+
+_API_GZIP_MIN_BYTES = 1024
+
+
+@app.after_request
+def compress_api_response(response):
+    """Gzip large JSON API responses for clients that accept it."""
+    if (
+        not request.path.startswith("/api/")
+        or response.direct_passthrough
+        or response.is_streamed
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+    body = response.get_data()
+    if len(body) < _API_GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(body, 6))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
 # HTML Template
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -604,7 +741,7 @@ HTML_TEMPLATE = """
         }
     </style>
 </head>
-<body>
+<body data-api-base="{{ root_path }}" data-ocr-enabled="{{ 'true' if default_ocr_enabled else 'false' }}">
     <div class="container">
         <div class="header">
             <h1>🌊 Surf</h1>
@@ -876,7 +1013,7 @@ HTML_TEMPLATE = """
     </div>
     
     <script>
-        const API_BASE = '{{ root_path }}';
+        const API_BASE = document.body.dataset.apiBase || '';
         let proxyModeTouched = false;
         let proxyModeProgrammaticUpdate = false;
         let langModeTouched = false;
@@ -884,7 +1021,7 @@ HTML_TEMPLATE = """
         let currentSiteDefaults = {
             site_name: null,
             lang_mode: 'trans',
-            ocr_enabled: {{ 'true' if default_ocr_enabled else 'false' }},
+            ocr_enabled: document.body.dataset.ocrEnabled === 'true',
         };
         let siteDefaultsRequestId = 0;
         let siteDefaultsTimer = null;
@@ -1147,7 +1284,7 @@ HTML_TEMPLATE = """
                 const itemTitle = result.title || `Item ${index + 1}`;
                 const source = result?.metadata?.source_url || result?.input_url || '';
                 const markdownBody = stripMarkdownHeading(result.markdown || '', itemTitle).trim();
-                const rawBody = stripMarkdownHeading(result.raw || '', itemTitle).trim();
+                const rawBody = stripMarkdownHeading(result.raw ?? result.markdown ?? '', itemTitle).trim();
                 const htmlBody = (result.html || '').trim();
 
                 markdownSections.push(`## ${itemTitle}\n\n${markdownBody || '_No content_'}`);
@@ -1327,7 +1464,7 @@ HTML_TEMPLATE = """
             card.dataset.translationJobId = result.translation_job_id || '';
             card.querySelector('[data-tab-content="markdown"] pre').textContent = result.markdown || '';
             card.querySelector('[data-tab-content="html"] pre').textContent = result.html || '';
-            card.querySelector('[data-tab-content="raw"] pre').textContent = result.raw || '';
+            card.querySelector('[data-tab-content="raw"] pre').textContent = result.raw ?? result.markdown ?? '';
             card.querySelector('.save-dir-input').value = (result.defaultDirs || {}).md || '';
             card.querySelector('.save-title-input').value = result.defaultSaveTitle || result.title || 'Untitled';
 
@@ -1363,6 +1500,55 @@ HTML_TEMPLATE = """
             container.appendChild(card);
         }
 
+        const PROCESS_STAGE_LABELS = {
+            fetch: '正在获取网页内容',
+            extract: '正在提取正文',
+            archive: '正在等待 Wayback 存档',
+        };
+
+        // Process one input via the progress stream; the final event carries the result.
+        async function processInput(itemData, onStage) {
+            const response = await fetch(API_BASE + '/api/process_stream', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(itemData)
+            });
+            if (!response.ok || !response.body) {
+                return parseJsonResponse(response);
+            }
+
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            while (true) {
+                const { value, done } = await reader.read();
+                if (done) {
+                    break;
+                }
+                buffer += decoder.decode(value, { stream: true });
+                let boundary;
+                while ((boundary = buffer.indexOf('\\n\\n')) !== -1) {
+                    const frame = buffer.slice(0, boundary);
+                    buffer = buffer.slice(boundary + 2);
+                    const payload = frame.split('\\n')
+                        .filter((line) => line.startsWith('data: '))
+                        .map((line) => line.slice(6))
+                        .join('\\n');
+                    if (!payload) {
+                        continue;
+                    }
+                    const event = JSON.parse(payload);
+                    if (event.stage === 'result') {
+                        return event.result;
+                    }
+                    onStage(event.stage);
+                }
+            }
+            throw new Error('处理进度流意外中断');
+        }
+
         // Form submission
         document.getElementById('surfForm').addEventListener('submit', async function(e) {
             e.preventDefault();
@@ -1412,15 +1598,10 @@ HTML_TEMPLATE = """
                     const input = inputs[i];
                     showStatus('processing', `正在处理 ${i + 1}/${inputs.length}: ${input}`);
                     const itemData = { ...data, url: input };
-                    const response = await fetch(API_BASE + '/api/process', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json'
-                        },
-                        body: JSON.stringify(itemData)
+                    const result = await processInput(itemData, (stage) => {
+                        const label = PROCESS_STAGE_LABELS[stage] || stage;
+                        showStatus('processing', `${label} ${i + 1}/${inputs.length}: ${input}`);
                     });
-
-                    const result = await parseJsonResponse(response);
                     if (result.success) {
                         result.input_url = input;
                         currentResults.push(result);
@@ -1434,7 +1615,7 @@ HTML_TEMPLATE = """
                                 fileType,
                                 saveDir,
                                 customTitle: autoTitle,
-                                data: result,
+                                ...saveResultRef(result),
                                 formData: data,
                                 speak: false
                             };
@@ -1594,9 +1775,11 @@ HTML_TEMPLATE = """
             saveJobIds.add(jobId);
 
             const delay = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+            let pollDelay = 500;
 
             while (true) {
-                await delay(2000);
+                await delay(pollDelay);
+                pollDelay = Math.min(pollDelay * 2, 2000);
                 try {
                     const response = await fetch(API_BASE + `/api/save-jobs/${encodeURIComponent(jobId)}`);
                     const job = await parseJsonResponse(response);
@@ -1640,6 +1823,11 @@ HTML_TEMPLATE = """
             return data;
         }
 
+        function saveResultRef(resultData) {
+            // Results kept by the server are saved by token instead of posting them back.
+            return resultData.result_token ? { result_token: resultData.result_token } : { data: resultData };
+        }
+
         async function saveFile(container, resultData, options = {}) {
             if (!resultData) {
                 showStatus('error', '没有可保存的内容');
@@ -1655,7 +1843,7 @@ HTML_TEMPLATE = """
                 fileType,
                 saveDir,
                 customTitle,
-                data: resultData,
+                ...saveResultRef(resultData),
                 formData: formData,
                 speak
             };
@@ -1707,9 +1895,118 @@ HTML_TEMPLATE = """
 """
 
 
+_INDEX_TEMPLATE = None
+_INDEX_PAGE = None
+# Page CSS/JS split out of HTML_TEMPLATE: file name -> (body, mimetype, encoded bodies).
+_INDEX_ASSETS = {}
+_STYLE_BLOCK_RE = re.compile(r"(<style>)(.*?)(</style>)", re.DOTALL)
+_SCRIPT_BLOCK_RE = re.compile(r"(<script>)(.*?)(</script>)", re.DOTALL)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_HTML_LINE_BREAK_RUN_RE = re.compile(r"[ \t]*\n\s*")
+_HTML_PRESERVED_BLOCK_RE = re.compile(r"(<(pre|textarea)\b.*?</\2>)", re.DOTALL | re.IGNORECASE)
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCTUATION_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_DECLARATION_COLON_RE = re.compile(r"([{;][\w-]+):\s+")
+
+
+def _minify_css(css):
+    """Drop comments and insignificant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = " ".join(css.split())
+    css = _CSS_PUNCTUATION_SPACE_RE.sub(r"\1", css)
+    css = _CSS_DECLARATION_COLON_RE.sub(r"\1:", css)
+    return css.replace(";}", "}").strip()
+
+
+def _minify_js(js):
+    """Drop indentation, blank lines and whole-line comments from a script.
+
+    Line breaks are kept so automatic semicolon insertion still applies.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _minify_html(html):
+    """Drop comments, indentation and blank lines from page markup.
+
+    Each line break is kept as a single one, so inline spacing renders the
+    same; <pre> and <textarea> content is left untouched.
+    """
+    parts = _HTML_PRESERVED_BLOCK_RE.split(html)
+    # split() yields text, block, tag-name triples; only the text is minified.
+    for index in range(0, len(parts), 3):
+        parts[index] = _HTML_LINE_BREAK_RUN_RE.sub("\n", _HTML_COMMENT_RE.sub("", parts[index]))
+    return "".join(part for index, part in enumerate(parts) if index % 3 != 2).strip()
+
+
+def _extract_index_assets(template):
+    """Move the page's <style> and <script> blocks out into cacheable assets.
+
+    Each block is minified and stored in _INDEX_ASSETS under a content-hashed
+    file name; the template gets a <link>/<script src> tag in its place and
+    the remaining markup is minified too.
+    """
+
+    def _externalize(match, extension, mimetype, minify, tag):
+        body = minify(match.group(2)).encode("utf-8")
+        name = f"surf.{hashlib.md5(body).hexdigest()[:12]}.{extension}"
+        _INDEX_ASSETS[name] = (body, mimetype, _compress_index_page(body))
+        return tag.format(url="{{ root_path }}/assets/" + name)
+
+    template = _STYLE_BLOCK_RE.sub(
+        lambda match: _externalize(match, "css", "text/css", _minify_css, '<link rel="stylesheet" href="{url}">'),
+        template,
+    )
+    template = _SCRIPT_BLOCK_RE.sub(
+        lambda match: _externalize(match, "js", "text/javascript", _minify_js, '<script src="{url}"></script>'),
+        template,
+    )
+    return _minify_html(template)
+
+
+def _get_index_template():
+    """Compile HTML_TEMPLATE, minus its assets, once and reuse the Jinja template object."""
+    global _INDEX_TEMPLATE
+    if _INDEX_TEMPLATE is None:
+        _INDEX_TEMPLATE = app.jinja_env.from_string(_extract_index_assets(HTML_TEMPLATE))
+    return _INDEX_TEMPLATE
+
+
+_CONFIG_CACHE = {"key": None, "config": None, "dirs_for": None, "dirs": None}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 def get_config():
-    """Get config object."""
-    return Config()
+    """Get config object, re-reading config.ini only when the file changes."""
+    config_path = _get_default_config_path()
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (config_path, mtime)
+    with _CONFIG_CACHE_LOCK:
+        if _CONFIG_CACHE["key"] != key:
+            _CONFIG_CACHE["config"] = Config(config_path)
+            _CONFIG_CACHE["key"] = key
+        return _CONFIG_CACHE["config"]
+
+
+def _default_dirs(config):
+    """Default save directory per file type, resolved once per loaded config."""
+    with _CONFIG_CACHE_LOCK:
+        if _CONFIG_CACHE["dirs_for"] is config:
+            return _CONFIG_CACHE["dirs"]
+    dirs = {
+        "md": config.get_path("Output", "md_dir", fallback="notes"),
+        "html": config.get_path("Output", "html_dir", fallback="web"),
+        "pdf": config.get_path("Output", "pdf_dir", fallback="pdf"),
+        "audio": config.get_path("Output", "audio_dir", fallback="audio"),
+    }
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE["dirs_for"] = config
+        _CONFIG_CACHE["dirs"] = dirs
+    return dirs
 
 
 def normalize_web_proxy_mode(mode):
@@ -1867,15 +2164,81 @@ def build_default_filename_stem(title, source_url=None, html_content=None):
     return OutputHandler._safe_filename_title(filename_title, max_len=100)
 
 
+def _remember_saved_file(path):
+    """Record a saved output file for /download lookups."""
+    if path:
+        abs_path = os.path.abspath(path)
+        _FILE_INDEX[os.path.basename(abs_path)] = abs_path
+    return path
+
+
+def _refresh_file_index(directories):
+    """Index the files directly inside *directories*; earlier directories win.
+
+    A directory is rescanned only when its mtime changed since the last scan,
+    so repeated misses cost one stat per directory; entries for files that
+    vanished from a rescanned directory are dropped.
+    """
+    for directory in directories:
+        directory = os.path.realpath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            if _FILE_INDEX_SCANS.get(directory) == mtime:
+                continue
+            with os.scandir(directory) as entries:
+                present = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        for name, path in list(_FILE_INDEX.items()):
+            if os.path.dirname(path) == directory and name not in present:
+                _FILE_INDEX.pop(name, None)
+        for name, path in present.items():
+            _FILE_INDEX.setdefault(name, path)
+        _FILE_INDEX_SCANS[directory] = mtime
+
+
+class _ServerBusyError(RuntimeError):
+    """Raised when no fetch slot frees up within _FETCH_SLOT_TIMEOUT."""
+
+
+@contextmanager
+def _fetch_slot(use_browser):
+    """Hold one browser or HTTP fetch slot for the duration of a fetch."""
+    slots = _BROWSER_FETCH_SLOTS if use_browser else _HTTP_FETCH_SLOTS
+    if not slots.acquire(timeout=_FETCH_SLOT_TIMEOUT):
+        raise _ServerBusyError("服务器繁忙，请稍后重试")
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+def _prune_finished_jobs(jobs):
+    """Drop jobs that finished more than _JOB_RETENTION_SECONDS ago; call under the store's lock."""
+    cutoff = time.time() - _JOB_RETENTION_SECONDS
+    for job_id in [
+        job_id
+        for job_id, job in jobs.items()
+        if job.get("status") in {"done", "error"} and job.get("updated_at", 0) < cutoff
+    ]:
+        del jobs[job_id]
+
+
 def _store_translation_job(job_id, payload):
     with _TRANSLATION_JOBS_LOCK:
+        _prune_finished_jobs(_TRANSLATION_JOBS)
         _TRANSLATION_JOBS[job_id] = payload
 
 
-def _get_translation_job(job_id):
+def _get_translation_job(job_id, include_source=True):
     with _TRANSLATION_JOBS_LOCK:
         job = _TRANSLATION_JOBS.get(job_id)
-        return copy.deepcopy(job) if job else None
+        if not job:
+            return None
+        if not include_source:
+            # Status polls never need the (large) source page; skip copying it.
+            job = {key: value for key, value in job.items() if key != "source"}
+        return copy.deepcopy(job)
 
 
 def _build_translated_web_result(base_result, translated_markdown, translated_title, translation_performed, lang_mode, translated_description=None):
@@ -1902,6 +2265,8 @@ def _build_translated_web_result(base_result, translated_markdown, translated_ti
         if translated_title:
             result["title"] = translated_title
 
+    if result.get("markdown") != original_markdown:
+        result.setdefault("raw", original_markdown)
     result["translated_title"] = translated_title
     result["translation_performed"] = translation_performed
     result["defaultSaveTitle"] = result.get("title") or result.get("defaultSaveTitle") or "Untitled"
@@ -1921,7 +2286,7 @@ def _run_web_translation_job(job_id):
     try:
         config = get_config()
         source = job["source"]
-        raw_markdown = source.get("raw_markdown") or source.get("raw") or ""
+        raw_markdown = source.get("raw", source.get("markdown")) or ""
         original_title = source.get("original_title") or source.get("title") or "Untitled"
         translator_model = None
         try:
@@ -1993,11 +2358,12 @@ def _enqueue_web_translation_job(source_result, llm_provider, lang_mode):
             "source": copy.deepcopy(source_result),
         },
     )
-    threading.Thread(target=_run_web_translation_job, args=(job_id,), daemon=True).start()
+    _TRANSLATION_EXECUTOR.submit(_run_web_translation_job, job_id)
     return job_id
 
 def _store_save_job(job_id, payload):
     with _SAVE_JOBS_LOCK:
+        _prune_finished_jobs(_SAVE_JOBS)
         _SAVE_JOBS[job_id] = payload
 
 
@@ -2025,21 +2391,24 @@ def _run_web_save_job(job_id):
         # then explicit translation_job_id, then cached data as last resort
         translation_job_id = data.get("translation_job_id")
         formData = data.get("formData")
-        cached_pending = (data.get("data") or {}).get("translation_pending")
-        cached_tjid = (data.get("data") or {}).get("translation_job_id")
+        cachedData = {} if formData or translation_job_id else _resolve_save_result(data)
+        cached_pending = cachedData.get("translation_pending")
+        cached_tjid = cachedData.get("translation_job_id")
         logger.warning(
             "Save worker resolving: tid=%s formData=%s dataPending=%s dataTid=%s",
             bool(translation_job_id), bool(formData), bool(cached_pending), bool(cached_tjid),
         )
         if formData:
             logger.warning("Save worker: re-processing with formData (lang=%s)", formData.get("lang"))
-            result, _lang_mode, _translation_pending = _process_web_request(formData, translate_sync=True)
+            result, _lang_mode, _translation_pending = _process_web_request(
+                formData, translate_sync=True, output_format=fileType
+            )
             resultData = result
         elif translation_job_id:
             logger.warning("Save worker: using explicit translation_job_id=%s", translation_job_id)
             resultData = _wait_for_translation_and_get_result(translation_job_id)
         else:
-            resultData = data.get("data", {})
+            resultData = cachedData
             logger.warning("Save worker: using cached resultData, pending=%s", bool(resultData.get("translation_pending")))
             if resultData.get("translation_pending") and resultData.get("translation_job_id"):
                 logger.warning("Save worker: cached resultData has pending translation, waiting for job %s", resultData["translation_job_id"])
@@ -2047,12 +2416,7 @@ def _run_web_save_job(job_id):
             if data.get("combine_all"):
                 resultData = build_combined_result_payload(data.get("results", [])) or {}
 
-        defaultDirs = {
-            "md": config.get_path("Output", "md_dir", fallback="notes"),
-            "html": config.get_path("Output", "html_dir", fallback="web"),
-            "pdf": config.get_path("Output", "pdf_dir", fallback="pdf"),
-            "audio": config.get_path("Output", "audio_dir", fallback="audio"),
-        }
+        defaultDirs = _default_dirs(config)
 
 
         if saveDir:
@@ -2063,7 +2427,7 @@ def _run_web_save_job(job_id):
 
         title = customTitle or resultData.get("title", "Untitled")
         metadata = resultData.get("metadata", {})
-        html_content = metadata.get("html_content", "")
+        html_content = _resolve_source_html(metadata)
         source_url = metadata.get("source_url")
 
         if fileType == "md":
@@ -2105,17 +2469,26 @@ def _run_web_save_job(job_id):
                 title, md_content, config, output_path=output_path
             )
         elif fileType == "audio":
-            md_content = resultData.get("markdown", "")
+            speech_text = resultData.get("speech_text")
             output_path = build_output_path(
                 title, "mp3", targetDir, source_url=source_url, html_content=html_content
             )
-            TTSHandler.run_tts(
-                title, md_content, config, speak=speak, save_path=output_path
+            save_path = TTSHandler.run_tts(
+                title,
+                speech_text if speech_text is not None else resultData.get("markdown", ""),
+                config,
+                speak=speak,
+                save_path=output_path,
+                is_plaintext=speech_text is not None,
             )
-            save_path = output_path
+            if not save_path:
+                raise ValueError("Audio generation failed")
         else:
             raise ValueError(f"Unsupported file type: {fileType}")
 
+        _remember_saved_file(save_path)
+        # Finished jobs only answer status polls; drop the submitted page data.
+        job.pop("data", None)
         _store_save_job(
             job_id,
             {
@@ -2128,6 +2501,7 @@ def _run_web_save_job(job_id):
         )
     except Exception as exc:
         logger.error("Web save job failed: %s", exc)
+        job.pop("data", None)
         _store_save_job(
             job_id,
             {
@@ -2150,14 +2524,182 @@ def _enqueue_web_save_job(save_data):
             "data": save_data,
         },
     )
-    threading.Thread(target=_run_web_save_job, args=(job_id,), daemon=True).start()
+    _WEB_EXECUTOR.submit(_run_web_save_job, job_id)
     return job_id
 
+def _result_cache_key(data):
+    """Build the result-cache key from every option submitted to /api/process.
+
+    The key also names the config.ini version (path and mtime), so editing the
+    config (target language, LLM, output dirs) stops serving older results.
+    """
+    get_config()
+    with _CONFIG_CACHE_LOCK:
+        config_key = _CONFIG_CACHE["key"]
+    return json.dumps([config_key, data], sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _get_cached_result(key):
+    with _RESULT_CACHE_LOCK:
+        entry = _RESULT_CACHE.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > _RESULT_CACHE_TTL:
+            del _RESULT_CACHE[key]
+            return None
+        _RESULT_CACHE.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+
+def _store_cached_result(key, value):
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = (time.time(), copy.deepcopy(value))
+        _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX_ENTRIES:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def _fetch_page_cached(key, fetch, use_cache=True):
+    """Return ``fetch()`` for *key*, reusing a recent result for the same key.
+
+    Concurrent calls for a key that is already being fetched wait for that
+    fetch instead of starting their own.
+    """
+    with _FETCH_CACHE_LOCK:
+        if use_cache:
+            entry = _FETCH_CACHE.get(key)
+            if entry is not None and time.time() - entry[0] <= _FETCH_CACHE_TTL:
+                _FETCH_CACHE.move_to_end(key)
+                return entry[1]
+        pending = _FETCH_IN_FLIGHT.get(key)
+        if pending is None:
+            pending = _FETCH_IN_FLIGHT[key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return pending.result()
+
+    try:
+        value = fetch()
+    except BaseException as exc:
+        with _FETCH_CACHE_LOCK:
+            _FETCH_IN_FLIGHT.pop(key, None)
+        pending.set_exception(exc)
+        raise
+    with _FETCH_CACHE_LOCK:
+        _FETCH_IN_FLIGHT.pop(key, None)
+        _FETCH_CACHE[key] = (time.time(), value)
+        _FETCH_CACHE.move_to_end(key)
+        while len(_FETCH_CACHE) > _FETCH_CACHE_MAX_ENTRIES:
+            _FETCH_CACHE.popitem(last=False)
+    pending.set_result(value)
+    return value
+
+
+def _stash_size(value, seen=None):
+    """Approximate memory held by the strings in *value*, counting each string object once."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sum(_stash_size(item, seen) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_stash_size(item, seen) for item in value)
+    return 0
+
+
+def _stash_for_save(value, pin=None):
+    """Keep *value* server-side for a later save and return its token.
+
+    *pin* names an entry *value* depends on (its page HTML); it is moved
+    behind the new entry so it never leaves the stash first. The oldest
+    entries are dropped once the stash exceeds _SAVE_STASH_MAX_ENTRIES or
+    _SAVE_STASH_MAX_BYTES.
+    """
+    token = uuid.uuid4().hex
+    size = _stash_size(value)
+    now = time.time()
+    with _SAVE_STASH_LOCK:
+        _SAVE_STASH[token] = (now, value, size)
+        if pin in _SAVE_STASH:
+            _, pinned, pinned_size = _SAVE_STASH.pop(pin)
+            _SAVE_STASH[pin] = (now, pinned, pinned_size)
+        total = sum(entry[2] for entry in _SAVE_STASH.values())
+        while len(_SAVE_STASH) > _SAVE_STASH_MAX_ENTRIES or total > _SAVE_STASH_MAX_BYTES:
+            oldest = next(iter(_SAVE_STASH))
+            if oldest in (token, pin):
+                break
+            total -= _SAVE_STASH.pop(oldest)[2]
+    return token
+
+
+def _lookup_save_stash(token):
+    """Return the value stashed under *token*, or None once it is gone."""
+    if not token:
+        return None
+    with _SAVE_STASH_LOCK:
+        entry = _SAVE_STASH.get(token)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > _SAVE_STASH_TTL:
+            del _SAVE_STASH[token]
+            return None
+        return entry[1]
+
+
+def _stash_source_html(html_content):
+    """Keep fetched page HTML server-side and return a token for it."""
+    return _stash_for_save(html_content) if html_content else None
+
+
+def _resolve_source_html(metadata):
+    """Return the page HTML sent inline in *metadata* or stashed under its token.
+
+    Raises ValueError once the token has expired, rather than saving without
+    the HTML (which would silently drop front matter).
+    """
+    if metadata.get("html_content"):
+        return metadata["html_content"]
+    token = metadata.get("html_token")
+    if not token:
+        return ""
+    html_content = _lookup_save_stash(token)
+    if html_content is None:
+        raise ValueError(_SAVE_EXPIRED_ERROR)
+    return html_content
+
+
+def _stash_result_for_save(result):
+    """Stash a copy of *result* for token saves and return its token.
+
+    The page HTML stays in its own entry, pinned behind the result so a token
+    save never finds the result without its HTML.
+    """
+    stashed = copy.deepcopy(result)
+    return _stash_for_save(stashed, pin=(stashed.get("metadata") or {}).get("html_token"))
+
+
+def _resolve_save_result(data):
+    """Return the result a save request refers to: inline "data" or a stashed "result_token"."""
+    if data.get("data"):
+        return data["data"]
+    if data.get("result_token"):
+        stashed = _lookup_save_stash(data["result_token"])
+        if stashed is None:
+            raise ValueError(_SAVE_EXPIRED_ERROR)
+        return copy.deepcopy(stashed)
+    return {}
+
+
 def _wait_for_translation_and_get_result(translation_job_id, timeout=300, poll_interval=2):
     """Poll an async translation job until completion, then return the translated result."""
     deadline = time.time() + timeout
     while time.time() < deadline:
-        job = _get_translation_job(translation_job_id)
+        job = _get_translation_job(translation_job_id, include_source=False)
         if not job:
             raise ValueError(f"Translation job {translation_job_id} not found")
         status = job.get("status")
@@ -2187,7 +2729,7 @@ def build_combined_result_payload(results):
         item_title = result.get("title") or f"Item {index}"
         source = (result.get("metadata") or {}).get("source_url") or result.get("input_url") or ""
         markdown_body = (result.get("markdown") or "").strip()
-        raw_body = (result.get("raw") or "").strip()
+        raw_body = (result.get("raw", result.get("markdown")) or "").strip()
         html_body = (result.get("html") or "").strip()
 
         markdown_sections.append(f"## {item_title}\n\n{markdown_body or '_No content_'}")
@@ -2266,20 +2808,84 @@ def resolve_web_site_defaults(config, url=None):
     }
 
 
+def _build_index_context(config):
+    """Collect the template variables for the main page."""
+    return {
+        "version": get_runtime_version(),
+        "is_windows": Fetcher._is_windows(),
+        "default_proxy_mode": resolve_web_proxy_mode_default(config),
+        "default_ocr_enabled": resolve_web_site_defaults(config)["ocr_enabled"],
+        "root_path": _ROOT_PATH,
+        **get_web_ui_context(config),
+    }
+
+
+def _compress_index_page(body):
+    """Precompress the rendered main page for each supported content encoding."""
+    encoded = {"gzip": gzip.compress(body, 9)}
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+    if brotli is not None:
+        encoded["br"] = brotli.compress(body, quality=11)
+    return encoded
+
+
+def _render_index_page(context):
+    """Return the rendered main page, re-rendering only when its context changes."""
+    global _INDEX_PAGE
+    key = json.dumps(context, sort_keys=True, ensure_ascii=False)
+    cached = _INDEX_PAGE
+    if cached is None or cached[0] != key:
+        body = _get_index_template().render(**context).encode("utf-8")
+        cached = (key, body, hashlib.md5(body).hexdigest(), _compress_index_page(body))
+        _INDEX_PAGE = cached
+    return cached[1], cached[2], cached[3]
+
+
 @app.route("/")
 def index():
     """Serve the main page."""
-    config = get_config()
-    ui_context = get_web_ui_context(config)
-    return render_template_string(
-        HTML_TEMPLATE,
-        version=get_runtime_version(),
-        is_windows=Fetcher._is_windows(),
-        default_proxy_mode=resolve_web_proxy_mode_default(config),
-        default_ocr_enabled=resolve_web_site_defaults(config)["ocr_enabled"],
-        root_path=_ROOT_PATH,
-        **ui_context,
-    )
+    body, etag, encoded = _render_index_page(_build_index_context(get_config()))
+    encoding = request.accept_encodings.best_match(["br", "gzip"])
+    if encoding in encoded:
+        response = Response(encoded[encoding], mimetype="text/html")
+        response.headers["Content-Encoding"] = encoding
+        etag = f"{etag}-{encoding}"
+    else:
+        response = Response(body, mimetype="text/html")
+    response.vary.add("Accept-Encoding")
+    # The page embeds config defaults, so revalidate each load; the ETag
+    # keeps that to a 304 while nothing has changed.
+    response.cache_control.no_cache = True
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+@app.route("/assets/<name>")
+def index_asset(name):
+    """Serve the page's stylesheet or script; names are content hashes, so cache them for good."""
+    _get_index_template()
+    asset = _INDEX_ASSETS.get(name)
+    if asset is None:
+        return jsonify({"error": "File not found"}), 404
+    body, mimetype, encoded = asset
+    etag = name.split(".")[1]
+    encoding = request.accept_encodings.best_match(["br", "gzip"])
+    if encoding in encoded:
+        response = Response(encoded[encoding], mimetype=mimetype)
+        response.headers["Content-Encoding"] = encoding
+        etag = f"{etag}-{encoding}"
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    # Browsers that revalidate on a forced reload get a 304.
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 
 @app.route("/api/proxy-default", methods=["GET"])
@@ -2303,7 +2909,7 @@ def site_defaults():
 @app.route("/api/translation-jobs/<job_id>", methods=["GET"])
 def translation_job_status(job_id):
     """Fetch the current status of an async translation job."""
-    job = _get_translation_job(job_id)
+    job = _get_translation_job(job_id, include_source=False)
     if not job:
         return jsonify({"success": False, "error": "Translation job not found"}), 404
 
@@ -2322,14 +2928,19 @@ def translation_job_status(job_id):
 
 
 
-def _process_web_request(data, translate_sync=False):
+def _process_web_request(data, translate_sync=False, progress=None, output_format=None, use_cache=True):
     """Core URL/text-post processing shared by /api/process and async save.
 
     When *translate_sync* is True, translation runs inline (suitable for
     background threads).  When False, the caller is responsible for spawning
     an async translation job — the returned result will have the raw content
-    and set ``translation_pending`` to True.
+    and set ``translation_pending`` to True.  *progress*, when given, is
+    called with a stage name as each slow step starts.  *output_format*
+    (md/html/pdf/audio) limits the work to what that save needs; None keeps
+    everything the preview shows.  With *use_cache*, a page fetched for the
+    same URL and fetch options within _FETCH_CACHE_TTL is reused.
     """
+    report = progress or (lambda stage: None)
 
     raw_url_input = data.get("url")
     save_full_text = bool(data.get("save_full_text", False))
@@ -2348,6 +2959,8 @@ def _process_web_request(data, translate_sync=False):
     translation_pending = False
     translated_description = None
     processed = {}
+    wayback_future = None
+    wants_wayback = bool(data.get("archive_source")) and not data.get("no_front_matter", False)
 
     # Fetch content
     proxy_mode = normalize_web_proxy_mode(data.get("proxy", "no"))
@@ -2391,43 +3004,61 @@ def _process_web_request(data, translate_sync=False):
                 logger.info(f"Web: {site_name} using default 'no translate'")
                 lang_mode = "raw"
 
-        html_content = Fetcher.fetch(
-            url,
-            config=config,
-            use_browser=data.get("browser", False),
-            proxy_mode_override=proxy_override,
-            custom_proxy_override=custom_proxy,
-            fetch_thread=fetch_thread,
-            fetch_thread_author=fetch_thread_author,
-        )
-        if not html_content:
-            raise ValueError(f"Failed to fetch usable content from {url}")
-
-        # Paywall detection and archive.is fallback
-        archive_is_url = None
-        paywall_result = Fetcher._detect_paywall(html_content, url=url)
-        if paywall_result and paywall_result.get("detected"):
-            logger.warning(
-                f"Paywall detected (confidence: {paywall_result['confidence']:.0%}): "
-                f"{paywall_result.get('reason', 'unknown')}"
-            )
-            logger.info("Attempting to fetch from archive.is...")
-            archived_html, snapshot_url = Fetcher._fetch_archiveis_snapshot(
-                url,
+        report("fetch")
+        use_browser = data.get("browser", False)
+
+        def _fetch_page():
+            with _fetch_slot(use_browser):
+                page_html = Fetcher.fetch(
+                    url,
+                    config=config,
+                    use_browser=use_browser,
+                    proxy_mode_override=proxy_override,
+                    custom_proxy_override=custom_proxy,
+                    fetch_thread=fetch_thread,
+                    fetch_thread_author=fetch_thread_author,
+                )
+            if not page_html:
+                raise ValueError(f"Failed to fetch usable content from {url}")
+
+            # Paywall detection and archive.is fallback
+            paywall_result = Fetcher._detect_paywall(page_html, url=url)
+            if paywall_result and paywall_result.get("detected"):
+                logger.warning(
+                    f"Paywall detected (confidence: {paywall_result['confidence']:.0%}): "
+                    f"{paywall_result.get('reason', 'unknown')}"
+                )
+                logger.info("Attempting to fetch from archive.is...")
+                archived_html, snapshot_url = Fetcher._fetch_archiveis_snapshot(
+                    url,
+                    config=config,
+                    proxy_mode_override=proxy_override,
+                    custom_proxy_override=custom_proxy,
+                )
+                if not archived_html:
+                    raise ValueError("内容受付费墙控制，未抓取全文")
+                logger.info("archive.is snapshot fetched successfully, using it as content source.")
+                return archived_html, snapshot_url
+            return page_html, None
+
+        fetch_key = (url, bool(use_browser), proxy_mode, custom_proxy, fetch_thread, fetch_thread_author)
+        html_content, archive_is_url = _fetch_page_cached(fetch_key, _fetch_page, use_cache=use_cache)
+
+        if wants_wayback and not archive_is_url:
+            # The snapshot only needs the source URL; request it while the
+            # page is being extracted, converted and OCR'd.
+            wayback_future = _WEB_IO_EXECUTOR.submit(
+                Fetcher.save_wayback_snapshot,
+                _extract_source_url_from_html(html_content, url),
                 config=config,
                 proxy_mode_override=proxy_override,
                 custom_proxy_override=custom_proxy,
             )
-            if archived_html:
-                logger.info("archive.is snapshot fetched successfully, using it as content source.")
-                archive_is_url = snapshot_url
-                html_content = archived_html
-            else:
-                raise ValueError("内容受付费墙控制，未抓取全文")
 
         pipeline_lang_mode = lang_mode
         if not translate_sync and lang_mode in {"trans", "both"}:
             pipeline_lang_mode = "raw"
+        report("extract")
         processed = _process_fetched_content(
             html_content,
             url,
@@ -2440,6 +3071,9 @@ def _process_web_request(data, translate_sync=False):
             custom_proxy_override=custom_proxy,
             llm_provider=(data.get("llm") or "").strip() or None,
             extractor=(data.get("extractor") or "auto").strip().lower(),
+            speech_only=output_format == "audio",
+            need_html=output_format in {None, "html"},
+            need_markdown=output_format != "html",
         )
         source_url = processed["source_url"]
         content_base_url = processed["content_base_url"]
@@ -2458,7 +3092,12 @@ def _process_web_request(data, translate_sync=False):
 
     # archive_url: prioritize archive.is snapshot (from paywall fallback)
     archive_url = archive_is_url
-    if not archive_url and data.get("archive_source") and not data.get("no_front_matter", False):
+    if wayback_future is not None:
+        if not wayback_future.done():
+            report("archive")
+        archive_url = wayback_future.result()
+    elif not archive_url and wants_wayback:
+        report("archive")
         archive_url = Fetcher.save_wayback_snapshot(
             source_url,
             config=config,
@@ -2467,12 +3106,7 @@ def _process_web_request(data, translate_sync=False):
         )
 
     # Get default directories for frontend
-    defaultDirs = {
-        "md": config.get_path("Output", "md_dir", fallback="notes"),
-        "html": config.get_path("Output", "html_dir", fallback="web"),
-        "pdf": config.get_path("Output", "pdf_dir", fallback="pdf"),
-        "audio": config.get_path("Output", "audio_dir", fallback="audio"),
-    }
+    defaultDirs = _default_dirs(config)
     defaultSaveTitle = build_default_filename_stem(
         title,
         source_url=source_url,
@@ -2483,8 +3117,6 @@ def _process_web_request(data, translate_sync=False):
         "title": title,
         "markdown": md_content,
         "html": cleaned_html,
-        "raw": original_md,
-        "raw_markdown": original_md,
         "original_title": original_title,
         "defaultDirs": defaultDirs,
         "defaultSaveTitle": defaultSaveTitle,
@@ -2494,7 +3126,7 @@ def _process_web_request(data, translate_sync=False):
         "translation_pending": translation_pending,
         "metadata": {
             "title": title,
-            "html_content": html_content,
+            "html_token": _stash_source_html(html_content),
             "original_description": processed.get("original_description"),
             "add_front_matter": not data.get("no_front_matter", False),
             "translated_title": translated_title if translation_performed else None,
@@ -2505,40 +3137,197 @@ def _process_web_request(data, translate_sync=False):
             "html_inline": data.get("html_inline", False),
         },
     }
+    # "raw" is only sent when it differs; clients fall back to "markdown".
+    if original_md != md_content:
+        result["raw"] = original_md
+    if processed.get("speech_text") is not None:
+        result["speech_text"] = processed["speech_text"]
     return result, lang_mode, translation_pending
-@app.route("/api/process", methods=["POST"])
-def process_url():
-    """Process a URL or free-form text post and return the result."""
+def _request_uses_result_cache(data):
+    """Honor ?nocache=1 or a "nocache" body flag (removed from *data*)."""
+    return request.args.get("nocache") != "1" and not data.pop("nocache", False)
 
-    data = request.get_json(silent=True) or {}
 
+def _request_process_timeout(data):
+    """Seconds to wait for processing: a positive "timeout" body field (removed from *data*) or the default.
+
+    The body field can only shorten the wait, never extend it past
+    _PROCESS_TIMEOUT_SECONDS.
+    """
+    try:
+        timeout = float(data.pop("timeout", None) or 0)
+    except (TypeError, ValueError):
+        timeout = 0
+    return min(timeout, _PROCESS_TIMEOUT_SECONDS) if timeout > 0 else _PROCESS_TIMEOUT_SECONDS
+
+
+def _start_process_request(data, use_cache=True, progress=None):
+    """Begin one /api/process submission; return a future for its processed value.
+
+    Cache hits come back as an already completed future; anything else is
+    queued on _PROCESS_EXECUTOR.
+    """
+    cache_key = _result_cache_key(data)
+
+    def _process_and_cache():
+        value = _process_web_request(data, translate_sync=False, progress=progress, use_cache=use_cache)
+        if not value[2]:
+            # Finished results are stashed once, so cache hits share the token.
+            value[0]["result_token"] = _stash_result_for_save(value[0])
+        _store_cached_result(cache_key, value)
+        return value
+
+    cached = _get_cached_result(cache_key) if use_cache else None
+    if cached is not None:
+        try:
+            _resolve_source_html(cached[0].get("metadata") or {})
+        except ValueError:
+            # Its page HTML has left the stash, so saves would fail; reprocess.
+            cached = None
+    if cached is None:
+        return _PROCESS_EXECUTOR.submit(_process_and_cache)
+    future = Future()
+    future.set_result(cached)
+    return future
+
+
+def _process_timed_out(future, timeout):
+    """Give up on *future* after *timeout* seconds and return the 504 payload.
+
+    Work still waiting in the queue is cancelled; work that already started
+    finishes in the background and lands in the result cache, so a retry can
+    pick it up.
+    """
+    future.cancel()
+    logger.warning(f"Processing timed out after {timeout:g}s")
+    return {"success": False, "error": f"处理超时（{timeout:g} 秒），请稍后重试", "timed_out": True}
+
+
+def _finish_process_request(data, future, timeout):
+    """Wait up to *timeout* seconds for *future* and return the submission's JSON payload."""
     try:
-        result, lang_mode, translation_pending = _process_web_request(data, translate_sync=False)
+        result, lang_mode, translation_pending = future.result(timeout=timeout)
         result["success"] = True
         if translation_pending:
             llm_provider = (data.get("llm") or "").strip() or None
-            job_id = _enqueue_web_translation_job(copy.deepcopy(result), llm_provider, lang_mode)
+            job_id = _enqueue_web_translation_job(result, llm_provider, lang_mode)
             result["translation_pending"] = True
             result["translation_job_id"] = job_id
-        return jsonify(result)
-
+            # Stash per request: the result names this request's translation job.
+            result["result_token"] = _stash_result_for_save(result)
+        elif _lookup_save_stash(result.get("result_token")) is None:
+            result.pop("result_token", None)
+            result["result_token"] = _stash_result_for_save(result)
+        return result
+
+    except _ServerBusyError as e:
+        return {"success": False, "error": str(e), "retry_after": _RETRY_AFTER_SECONDS}
+    except FutureTimeoutError:
+        return _process_timed_out(future, timeout)
     except ValueError as e:
-        return jsonify({"success": False, "error": str(e)})
+        return {"success": False, "error": str(e)}
     except Exception as e:
-        logger.error(f"Processing failed: {e}")
-        return jsonify({"success": False, "error": str(e)})
+        logger.exception(f"Processing failed: {e}")
+        return {"success": False, "error": str(e)}
+
+
+def _handle_process_request(data, use_cache=True, timeout=None):
+    """Run one /api/process submission on _PROCESS_EXECUTOR and return its JSON payload."""
+    future = _start_process_request(data, use_cache=use_cache)
+    return _finish_process_request(data, future, timeout or _PROCESS_TIMEOUT_SECONDS)
+
+
+@app.route("/api/process", methods=["POST"])
+def process_url():
+    """Process a URL or free-form text post and return the result."""
+
+    data = request.get_json(silent=True) or {}
+    use_cache = _request_uses_result_cache(data)
+    timeout = _request_process_timeout(data)
+    payload = _handle_process_request(data, use_cache=use_cache, timeout=timeout)
+    if payload.get("retry_after"):
+        response = jsonify(payload)
+        response.status_code = 503
+        response.headers["Retry-After"] = str(payload["retry_after"])
+        return response
+    if payload.get("timed_out"):
+        return jsonify(payload), 504
+    return jsonify(payload)
+
+
+@app.route("/api/process_stream", methods=["POST"])
+def process_url_stream():
+    """Process like /api/process, reporting progress as Server-Sent Events.
+
+    Stage events (fetch, extract, archive) are coalesced into one write per
+    flush interval; the last event has stage "result" and carries the same
+    payload /api/process would return. Quiet stretches get a comment frame
+    every _PROCESS_STREAM_HEARTBEAT_SECONDS, and the stream ends with a timeout
+    result once the processing timeout passes.
+    """
+    data = request.get_json(silent=True) or {}
+    use_cache = _request_uses_result_cache(data)
+    timeout = _request_process_timeout(data)
+    events = queue.Queue()
+    future = _start_process_request(data, use_cache=use_cache, progress=lambda stage: events.put({"stage": stage}))
+    # Wake the generator as soon as processing ends; progress events all come first.
+    future.add_done_callback(lambda _future: events.put(None))
+
+    def _generate():
+        deadline = time.monotonic() + timeout
+        finished = False
+        while not finished and time.monotonic() < deadline:
+            wait = min(_PROCESS_STREAM_HEARTBEAT_SECONDS, max(deadline - time.monotonic(), 0))
+            try:
+                event = events.get(timeout=wait)
+            except queue.Empty:
+                # Keep proxies from closing an idle stream; clients skip comment frames.
+                yield ": keep-alive\n\n"
+                continue
+            batch = []
+            flush_at = time.monotonic() + _PROCESS_STREAM_FLUSH_SECONDS
+            while event is not None:
+                batch.append(event)
+                remaining = flush_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = events.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            finished = event is None
+            if batch:
+                yield "".join(f"data: {app.json.dumps(item)}\n\n" for item in batch)
+        if finished:
+            payload = _finish_process_request(data, future, timeout)
+        else:
+            payload = _process_timed_out(future, timeout)
+        yield f"data: {app.json.dumps({'stage': 'result', 'result': payload})}\n\n"
+
+    return Response(
+        _generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/download/<filename>")
 def download_file(filename):
     """Download a generated file."""
-    # Search in common output directories
-    search_dirs = [".", "notes", "pdf", "audio", "web", "html"]
+    name = os.path.basename(filename)
+    if not name or name != filename:
+        return jsonify({"error": "File not found"}), 404
 
-    for directory in search_dirs:
-        filepath = os.path.join(directory, filename)
-        if os.path.exists(filepath):
-            return send_file(filepath, as_attachment=True)
-
-    return jsonify({"error": "File not found"}), 404
+    path = _FILE_INDEX.get(name)
+    if not path or not os.path.isfile(path):
+        # Not saved by this process (or since removed): index the configured
+        # output directories that changed and look again.
+        _FILE_INDEX.pop(name, None)
+        _refresh_file_index(_default_dirs(get_config()).values())
+        path = _FILE_INDEX.get(name)
+    if not path:
+        return jsonify({"error": "File not found"}), 404
+    return send_from_directory(os.path.dirname(path), name, as_attachment=True, conditional=True, max_age=0)
 
 
 
@@ -2591,6 +3380,8 @@ def play_audio():
         md_content = resultData.get("markdown", "")
         if not md_content.strip():
             return jsonify({"success": False, "error": "No text content to speak"})
+        # Playback blocks for as long as the audio plays, so keep it out of
+        # the bounded job pools.
         threading.Thread(
             target=TTSHandler.run_tts,
             args=(title, md_content, config),
@@ -2610,7 +3401,10 @@ def save_file():
     fileType = data.get("fileType")
     saveDir = data.get("saveDir", "").strip()
     customTitle = (data.get("customTitle") or "").strip()
-    resultData = data.get("data", {})
+    try:
+        resultData = _resolve_save_result(data)
+    except ValueError as exc:
+        return jsonify({"success": False, "error": str(exc)})
     if data.get("combine_all"):
         resultData = build_combined_result_payload(data.get("results", [])) or {}
     speak = bool(data.get("speak"))
@@ -2621,12 +3415,7 @@ def save_file():
     config = get_config()
 
     # Determine default directories based on config
-    defaultDirs = {
-        "md": config.get_path("Output", "md_dir", fallback="notes"),
-        "html": config.get_path("Output", "html_dir", fallback="web"),
-        "pdf": config.get_path("Output", "pdf_dir", fallback="pdf"),
-        "audio": config.get_path("Output", "audio_dir", fallback="audio"),
-    }
+    defaultDirs = _default_dirs(config)
 
     # Use user-specified directory or default
     if saveDir:
@@ -2640,7 +3429,7 @@ def save_file():
     try:
         title = customTitle or resultData.get("title", "Untitled")
         metadata = resultData.get("metadata", {})
-        html_content = metadata.get("html_content", "")
+        html_content = _resolve_source_html(metadata)
         source_url = metadata.get("source_url")
 
         if fileType == "md":
@@ -2661,7 +3450,7 @@ def save_file():
                 translator=metadata.get("translator"),
                 archive_url=metadata.get("archive_url"),
             )
-            return jsonify({"success": True, "savePath": md_path})
+            return jsonify({"success": True, "savePath": _remember_saved_file(md_path)})
 
         elif fileType == "html":
             cleaned_html = resultData.get("html", "")
@@ -2675,7 +3464,7 @@ def save_file():
                 inline=metadata.get("html_inline", False),
                 output_path=output_path,
             )
-            return jsonify({"success": True, "savePath": html_path})
+            return jsonify({"success": True, "savePath": _remember_saved_file(html_path)})
 
         elif fileType == "pdf":
             md_content = resultData.get("markdown", "")
@@ -2685,18 +3474,19 @@ def save_file():
             pdf_path = OutputHandler.generate_pdf(
                 title, md_content, config, output_path=output_path
             )
-            return jsonify({"success": True, "savePath": pdf_path})
+            return jsonify({"success": True, "savePath": _remember_saved_file(pdf_path)})
 
         elif fileType == "audio":
             md_content = resultData.get("markdown", "")
             output_path = build_output_path(
                 title, "mp3", targetDir, source_url=source_url, html_content=html_content
             )
-            TTSHandler.run_tts(
+            audio_path = TTSHandler.run_tts(
                 title, md_content, config, speak=speak, save_path=output_path
             )
-
-            return jsonify({"success": True, "savePath": output_path})
+            if not audio_path:
+                return jsonify({"success": False, "error": "Audio generation failed"})
+            return jsonify({"success": True, "savePath": _remember_saved_file(audio_path)})
 
         else:
             return jsonify({"success": False, "error": "Unsupported file type"})
@@ -2706,8 +3496,79 @@ def save_file():
         return jsonify({"success": False, "error": str(e)})
 
 
-def run_server(host="127.0.0.1", port=18473, debug=False, root=""):
-    """Run the web server."""
+def _gunicorn_bind(host, port):
+    """Format *host* and *port* as a gunicorn bind address, bracketing IPv6 literals."""
+    if ":" in host and not host.startswith("["):
+        return f"[{host}]:{port}"
+    return f"{host}:{port}"
+
+
+def _serve_with_gunicorn(host, port, workers, threads):
+    """Serve the app with gunicorn's threaded workers; False if unavailable."""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        return False
+
+    class _SurfGunicornApplication(BaseApplication):
+        def __init__(self, wsgi_app, options):
+            self.application = wsgi_app
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    _SurfGunicornApplication(
+        app,
+        {
+            "bind": _gunicorn_bind(host, port),
+            "workers": workers,
+            "threads": threads,
+            "worker_class": "gthread",
+        },
+    ).run()
+    return True
+
+
+def _serve_with_waitress(host, port, threads):
+    """Serve the app with waitress; False if unavailable."""
+    try:
+        from waitress import serve
+    except ImportError:
+        return False
+    serve(app, host=host, port=port, threads=threads)
+    return True
+
+
+_BROWSER_PROBE_INTERVAL = 0.02
+_BROWSER_PROBE_CONNECT_TIMEOUT = 0.05
+
+
+def _open_browser_when_ready(host, port, url, timeout=5.0):
+    """Open *url* once the server accepts connections (or after *timeout*)."""
+    probe_host = "127.0.0.1" if host in {"", "0.0.0.0"} else ("::1" if host == "::" else host)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((probe_host, port), timeout=_BROWSER_PROBE_CONNECT_TIMEOUT):
+                break
+        except OSError:
+            time.sleep(_BROWSER_PROBE_INTERVAL)
+    webbrowser.open(url)
+
+
+def run_server(host="127.0.0.1", port=18473, debug=False, root="", workers=1, threads=8, dev=False, open_browser=True):
+    """Run the web server.
+
+    Uses gunicorn (Linux/macOS) or waitress (Windows), whichever the platform
+    dependency installed, and falls back to Flask's development server when
+    neither is available or when *dev*/*debug* is set.
+    """
     global _ROOT_PATH
     if root:
         _ROOT_PATH = root.rstrip("/")
@@ -2716,7 +3577,10 @@ def run_server(host="127.0.0.1", port=18473, debug=False, root=""):
     # Open browser
     base = f"http://{host}:{port}"
     url = f"{base}{_ROOT_PATH}" if _ROOT_PATH else base
-    threading.Timer(1, lambda: webbrowser.open(url)).start()
+    if open_browser and not os.environ.get("WERKZEUG_RUN_MAIN"):
+        threading.Thread(
+            target=_open_browser_when_ready, args=(host, port, url), daemon=True
+        ).start()
 
     print(f"\nSurf Web Interface v{get_runtime_version()}")
     print("=====================================")
@@ -2725,6 +3589,17 @@ def run_server(host="127.0.0.1", port=18473, debug=False, root=""):
         print(f"Root path prefix: {_ROOT_PATH}")
     print("Press Ctrl+C to stop\n")
 
+    if not (dev or debug):
+        if Fetcher._is_windows():
+            served = _serve_with_waitress(host, port, threads)
+        else:
+            served = _serve_with_gunicorn(host, port, workers, threads) or _serve_with_waitress(
+                host, port, threads
+            )
+        if served:
+            return
+        logger.warning("Neither gunicorn nor waitress is installed; using Flask's development server.")
+
     app.run(host=host, port=port, debug=debug)
 
 
@@ -2741,16 +3616,42 @@ def main():
     parser.add_argument(
         "--port", type=int, default=18473, help="Port to bind (default: 18473)"
     )
-    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode (implies --dev)")
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Use Flask's development server instead of gunicorn/waitress",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="gunicorn worker processes (default: 1; background jobs and caches are per process)",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=8, help="Request threads per worker (default: 8)"
+    )
     parser.add_argument("--bind", help="Bind address (deprecated, use --host)")
     parser.add_argument(
         "--root", default="", help="URL path prefix for reverse proxy (e.g. /surf)"
     )
+    parser.add_argument(
+        "--no-browser", action="store_true", help="Do not open a browser window on startup"
+    )
 
     args = parser.parse_args()
 
     host = args.bind if args.bind else args.host
-    run_server(host=host, port=args.port, debug=args.debug, root=args.root)
+    run_server(
+        host=host,
+        port=args.port,
+        debug=args.debug,
+        root=args.root,
+        workers=max(1, args.workers),
+        threads=max(1, args.threads),
+        dev=args.dev,
+        open_browser=not args.no_browser,
+    )
 
 
 if __name__ == "__main__":
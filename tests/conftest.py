@@ -0,0 +1,13 @@
+import pytest
+
+import surf_web
+
+
+@pytest.fixture(autouse=True)
+def _clear_web_result_cache():
+    """Keep /api/process results and fetched pages from leaking between tests that reuse URLs."""
+    surf_web._RESULT_CACHE.clear()
+    surf_web._FETCH_CACHE.clear()
+    yield
+    surf_web._RESULT_CACHE.clear()
+    surf_web._FETCH_CACHE.clear()
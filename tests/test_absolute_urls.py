@@ -0,0 +1,23 @@
+from surf import OutputHandler
+
+
+def test_markdown_urls_become_absolute_without_touching_other_inline_html():
+    md = '[link](/a) ![img](x.png) <span class="note">kept</span> <video src="v.mp4"> [mail](mailto:a@b)'
+
+    converted = OutputHandler._convert_markdown_urls_to_absolute(md, "https://example.com/dir/page")
+
+    assert converted == (
+        "[link](https://example.com/a) ![img](https://example.com/dir/x.png) "
+        '<span class="note">kept</span> <video src="https://example.com/dir/v.mp4"></video> [mail](mailto:a@b)'
+    )
+
+
+def test_html_urls_become_absolute_in_one_pass():
+    html = "<p><a href='/x'>x</a><img srcset='a.png 1x'><a href='#top'>t</a><form action='post'></form></p>"
+
+    converted = OutputHandler._convert_urls_to_absolute(html, "https://example.com/dir/")
+
+    assert converted == (
+        '<p><a href="https://example.com/x">x</a><img srcset="https://example.com/dir/a.png 1x"/>'
+        '<a href="#top">t</a><form action="https://example.com/dir/post"></form></p>'
+    )
@@ -0,0 +1,12 @@
+from surf import OutputHandler
+
+
+def test_sanitize_filename_keeps_letters_digits_and_safe_punctuation():
+    assert OutputHandler._sanitize_filename("Héllo: wörld/2024 *final*_v1.md  ") == "Héllo wörld2024 final_v1.md"
+
+
+def test_safe_filename_title_strips_invalid_chars_and_reserved_names():
+    assert OutputHandler._safe_filename_title('a<b>:c"d/e\\f|g?h*i\x01  x   y. ') == "abcdefghi x y"
+    assert OutputHandler._safe_filename_title("com1") == "com1_"
+    assert OutputHandler._safe_filename_title("") == "Untitled"
+    assert OutputHandler._safe_filename_title("标题：测试", max_len=3) == "标题："
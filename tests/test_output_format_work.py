@@ -0,0 +1,41 @@
+import surf
+
+
+class _FakeConfig:
+    def get(self, section, key, fallback=None):
+        return fallback
+
+
+_HTML = (
+    "<html><head><title>Post</title></head><body><article><p>"
+    + ("Body text with a <a href='/next'>link</a>. " * 20)
+    + "</p></article></body></html>"
+)
+
+
+def _fail(name):
+    def _raise(*args, **kwargs):
+        raise AssertionError(f"{name} should be skipped")
+
+    return staticmethod(_raise)
+
+
+def test_markdown_only_pipeline_skips_html_link_rewrite(monkeypatch):
+    monkeypatch.setattr(surf.OutputHandler, "_convert_urls_to_absolute", _fail("HTML link rewrite"))
+
+    processed = surf._process_fetched_content(
+        _HTML, "https://example.com/post", _FakeConfig(), lang_mode="raw", need_html=False
+    )
+
+    assert "https://example.com/next" in processed["markdown"]
+
+
+def test_html_only_pipeline_skips_markdown_conversion(monkeypatch):
+    monkeypatch.setattr(surf.ContentProcessor, "to_markdown", _fail("markdown conversion"))
+
+    processed = surf._process_fetched_content(
+        _HTML, "https://example.com/post", _FakeConfig(), lang_mode="raw", need_markdown=False
+    )
+
+    assert processed["markdown"] == ""
+    assert 'href="https://example.com/next"' in processed["cleaned_html"]
@@ -166,6 +166,33 @@ def test_generic_fetch_uses_system_trust_requests_session(monkeypatch):
     assert calls[0][0][0] == url
 
 
+def test_browser_fetch_reuses_already_resolved_proxies(monkeypatch):
+    config = _FakeConfig()
+    resolved = (
+        {"http": "http://localhost:7890", "https": "http://localhost:7890"},
+        {"server": "http://localhost:7890"},
+    )
+    proxy_lookups = []
+    browser_calls = []
+
+    def _fake_get_proxies(config, proxy_mode_override=None, custom_proxy_override=None):
+        proxy_lookups.append(proxy_mode_override)
+        return resolved
+
+    def _fake_browser(*args, **kwargs):
+        browser_calls.append(kwargs)
+        return "<html>" + ("b" * 1200) + "</html>"
+
+    monkeypatch.setattr(surf.Fetcher, "_get_proxies", staticmethod(_fake_get_proxies))
+    monkeypatch.setattr(surf.Fetcher, "fetch_with_browser", staticmethod(_fake_browser))
+
+    html = surf.Fetcher.fetch("https://example.com/post", config, use_browser=True, proxy_mode_override="custom")
+
+    assert "bbbb" in html
+    assert proxy_lookups == ["custom"]
+    assert browser_calls[0]["_resolved_proxies"] == resolved
+
+
 def test_default_config_prefers_executable_directory(monkeypatch, tmp_path):
     exe_dir = tmp_path / "bin"
     exe_dir.mkdir()
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from surf import _build_direct_markdown_payload
+import surf_web
 from surf_web import app, Fetcher
 
 
@@ -32,7 +33,7 @@ def test_process_url_accepts_direct_markdown_payload(monkeypatch):
     assert data["success"] is True
     assert data["title"] == "Example Topic"
     assert data["defaultSaveTitle"] == "Example Topic"
-    assert data["raw"] == data["markdown"]
+    assert "raw" not in data
     assert "Author: alice" not in data["markdown"]
     assert "Node: Test Node" not in data["markdown"]
     assert "Published: 2026-04-24 18:51:29 +08:00" not in data["markdown"]
@@ -124,3 +125,72 @@ def test_save_endpoint_can_merge_multiple_results(monkeypatch, tmp_path):
     assert saved["title"] == "Merged Notes"
     assert "## First" in saved["content"]
     assert "## Second" in saved["content"]
+
+
+def test_process_keeps_page_html_server_side_for_save(monkeypatch, tmp_path):
+    page = "<html><head><title>Kept Title</title></head><body><article><p>" + "Body text. " * 40 + "</p></article></body></html>"
+    monkeypatch.setattr(Fetcher, "fetch", lambda *args, **kwargs: page)
+    seen = {}
+
+    def fake_save_markdown(title, content, config, **kwargs):
+        seen["html_content"] = kwargs["html_content"]
+        Path(kwargs["output_path"]).write_text(content, encoding="utf-8")
+        return kwargs["output_path"]
+
+    monkeypatch.setattr("surf_web.OutputHandler.save_markdown", fake_save_markdown)
+    client = app.test_client()
+
+    result = client.post("/api/process", json={"url": "https://example.com/post", "lang": "raw", "proxy": "no"}).get_json()
+    response = client.post("/api/save", json={"fileType": "md", "saveDir": str(tmp_path), "data": result})
+
+    assert "html_content" not in result["metadata"]
+    assert result["metadata"]["html_token"]
+    assert response.get_json()["success"] is True
+    assert seen["html_content"] == page
+
+
+def test_stashed_result_never_outlives_its_page_html(monkeypatch, tmp_path):
+    page = "<html><head><title>Kept Title</title></head><body><article><p>" + "Body text. " * 40 + "</p></article></body></html>"
+    monkeypatch.setattr(Fetcher, "fetch", lambda *args, **kwargs: page)
+    monkeypatch.setattr(surf_web, "_SAVE_STASH", surf_web.OrderedDict())
+    monkeypatch.setattr(surf_web, "_SAVE_STASH_MAX_ENTRIES", 3)
+    seen = []
+
+    def fake_save_markdown(title, content, config, **kwargs):
+        seen.append(kwargs["html_content"])
+        Path(kwargs["output_path"]).write_text(content, encoding="utf-8")
+        return kwargs["output_path"]
+
+    monkeypatch.setattr("surf_web.OutputHandler.save_markdown", fake_save_markdown)
+    client = app.test_client()
+
+    def save(**ref):
+        return client.post("/api/save", json={"fileType": "md", "saveDir": str(tmp_path), **ref}).get_json()
+
+    result = client.post("/api/process", json={"url": "https://example.com/evicted", "lang": "raw", "proxy": "no"}).get_json()
+    stashed_metadata = surf_web._lookup_save_stash(result["result_token"])["metadata"]
+    surf_web._stash_for_save("filler")
+    kept = save(result_token=result["result_token"])
+    surf_web._stash_for_save("filler")
+    evicted = save(result_token=result["result_token"])
+    inline = save(data=result)
+    surf_web._SAVE_STASH.pop(result["metadata"]["html_token"])
+    html_gone = save(data=result)
+
+    assert "html_content" not in stashed_metadata
+    assert kept["success"] is True
+    assert evicted == {"success": False, "error": surf_web._SAVE_EXPIRED_ERROR}
+    assert inline["success"] is True
+    assert seen == [page, page]
+    assert html_gone == {"success": False, "error": surf_web._SAVE_EXPIRED_ERROR}
+
+
+def test_save_stash_is_bounded_by_total_size(monkeypatch):
+    monkeypatch.setattr(surf_web, "_SAVE_STASH", surf_web.OrderedDict())
+    monkeypatch.setattr(surf_web, "_SAVE_STASH_MAX_BYTES", 3 * surf_web.sys.getsizeof("x" * 1000))
+    page = "x" * 1000
+
+    tokens = [surf_web._stash_for_save({"html": page, "metadata": {"html_content": page}}) for _ in range(4)]
+
+    assert surf_web._stash_size({"html": page, "metadata": {"html_content": page}}) == surf_web.sys.getsizeof(page)
+    assert [surf_web._lookup_save_stash(token) is not None for token in tokens] == [False, True, True, True]
@@ -0,0 +1,95 @@
+import threading
+
+import openai
+
+import surf
+
+
+class _FakeConfig:
+    def get(self, section, key, fallback=None):
+        return fallback
+
+    def get_llm_config(self, provider=None):
+        return {"base_url": "https://llm.example/v1", "api_key": "k", "model": "fake-model"}
+
+
+class _FakeHttpClient:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _install_fake_llm(monkeypatch, calls):
+    class _FakeOpenAI:
+        def __init__(self, **kwargs):
+            self.chat = self
+            self.completions = self
+
+        def create(self, model, messages):
+            calls.append(messages[-1]["content"])
+            message = type("Message", (), {"content": "译文 " + messages[-1]["content"]})
+            choice = type("Choice", (), {"message": message})
+            return type("Completion", (), {"choices": [choice]})
+
+    monkeypatch.setattr(openai, "OpenAI", _FakeOpenAI)
+    monkeypatch.setattr(
+        surf.ContentProcessor,
+        "_create_translation_http_client",
+        staticmethod(lambda max_connections: _FakeHttpClient()),
+    )
+
+
+def test_translate_if_needed_reuses_cached_translation(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    calls = []
+    _install_fake_llm(monkeypatch, calls)
+    text = "This is an English paragraph that clearly needs translating into Chinese."
+
+    first = surf.ContentProcessor.translate_if_needed(text, title="Hello", config=_FakeConfig())
+    second = surf.ContentProcessor.translate_if_needed(text, title="Hello", config=_FakeConfig())
+
+    assert first == second == ("译文 " + text, "译文 Hello")
+    assert sorted(calls) == sorted(["Hello", text])
+    assert len(list((tmp_path / "surf" / "translations").glob("*.json"))) == 1
+
+
+def test_translation_cache_can_be_disabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    class _NoCacheConfig(_FakeConfig):
+        def get(self, section, key, fallback=None):
+            if (section, key) == ("LLM", "translation_cache"):
+                return "false"
+            return fallback
+
+    calls = []
+    _install_fake_llm(monkeypatch, calls)
+    text = "Another English paragraph that should be translated every single time."
+
+    surf.ContentProcessor.translate_if_needed(text, config=_NoCacheConfig())
+    surf.ContentProcessor.translate_if_needed(text, config=_NoCacheConfig())
+
+    assert calls == [text, text]
+    assert not (tmp_path / "surf").exists()
+
+
+def test_title_translation_overlaps_content_chunks(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    both_in_flight = threading.Barrier(2)
+    calls = []
+    _install_fake_llm(monkeypatch, calls)
+    fake_openai = openai.OpenAI
+    original_create = fake_openai.create
+
+    def _create(self, model, messages):
+        both_in_flight.wait(timeout=5)
+        return original_create(self, model, messages)
+
+    monkeypatch.setattr(fake_openai, "create", _create)
+    text = "A single English chunk whose title request should not wait for it."
+
+    result = surf.ContentProcessor.translate_if_needed(text, title="Hello", config=_FakeConfig())
+
+    assert result == ("译文 " + text, "译文 Hello")
@@ -0,0 +1,41 @@
+import surf
+
+
+def _reference_chunks(text, max_chars):
+    chunks = []
+    current_chunk = []
+    current_len = 0
+    for paragraph in text.split("\n\n"):
+        if current_len + len(paragraph) + 2 > max_chars and current_chunk:
+            chunks.append("\n\n".join(current_chunk))
+            current_chunk = []
+            current_len = 0
+        current_chunk.append(paragraph)
+        current_len += len(paragraph) + 2
+    if current_chunk:
+        chunks.append("\n\n".join(current_chunk))
+    return chunks
+
+
+def test_chunk_text_matches_paragraph_split_semantics():
+    samples = [
+        "",
+        "single paragraph",
+        "a\n\nb\n\nc",
+        "trailing\n\n",
+        "\n\nleading",
+        "odd\n\n\nnewlines\n\n\n\nhere",
+        "\n\n".join(f"Paragraph {i} " + "x" * (i * 37 % 300) for i in range(200)),
+        "x" * 9000 + "\n\nshort\n\n" + "y" * 5000,
+    ]
+    for text in samples:
+        for max_chars in (1, 50, 400, 4000):
+            assert surf.ContentProcessor._chunk_text(text, max_chars=max_chars) == _reference_chunks(text, max_chars)
+
+
+def test_chunk_text_round_trips_original_text():
+    text = "\n\n".join(f"Line {i}\nwith soft break" for i in range(500))
+    chunks = surf.ContentProcessor._chunk_text(text, max_chars=1000)
+    assert len(chunks) > 1
+    assert "\n\n".join(chunks) == text
+    assert all(len(chunk) <= 1000 for chunk in chunks)
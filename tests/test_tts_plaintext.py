@@ -0,0 +1,112 @@
+import sys
+import types
+
+import surf
+
+
+class _FakeConfig:
+    def get(self, section, key, fallback=None):
+        return fallback
+
+
+def test_to_plaintext_drops_markup_and_keeps_block_breaks():
+    html = (
+        "<div><h1>Title</h1><p>Hello <b>world</b> and <a href='x'>link</a>.</p>"
+        "<script>bad()</script><ul><li>one</li><li>two</li></ul></div>"
+    )
+
+    text = surf.ContentProcessor.to_plaintext(html)
+
+    assert text == "Title\nHello world and link.\none\ntwo"
+
+
+def test_speech_only_raw_pipeline_skips_markdown(monkeypatch):
+    monkeypatch.setattr(
+        surf.ContentProcessor,
+        "to_markdown",
+        staticmethod(lambda html: (_ for _ in ()).throw(AssertionError("markdown conversion should be skipped"))),
+    )
+    html = "<html><head><title>Post</title></head><body><article><p>" + ("Spoken text. " * 20) + "</p></article></body></html>"
+
+    processed = surf._process_fetched_content(
+        html,
+        "https://example.com/post",
+        _FakeConfig(),
+        lang_mode="raw",
+        speech_only=True,
+    )
+
+    assert processed["markdown"] == ""
+    assert processed["speech_text"].startswith("Spoken text.")
+
+
+def test_run_tts_returns_saved_path(monkeypatch, tmp_path):
+    async def _fake_generate_speech(text, output_file, config):
+        with open(output_file, "wb") as handle:
+            handle.write(b"mp3")
+
+    monkeypatch.setattr(surf.TTSHandler, "generate_speech", staticmethod(_fake_generate_speech))
+    target = tmp_path / "post.mp3"
+
+    saved = surf.TTSHandler.run_tts("Post", "Hello", _FakeConfig(), save_path=str(target))
+
+    assert saved == str(target)
+    assert target.read_bytes() == b"mp3"
+
+
+def test_run_tts_returns_none_when_generation_fails(monkeypatch, tmp_path):
+    async def _failing_generate_speech(text, output_file, config):
+        raise RuntimeError("tts backend down")
+
+    monkeypatch.setattr(surf.TTSHandler, "generate_speech", staticmethod(_failing_generate_speech))
+
+    assert surf.TTSHandler.run_tts("Post", "Hello", _FakeConfig(), save_path=str(tmp_path / "post.mp3")) is None
+
+
+def test_run_tts_falls_back_to_save_then_play_when_player_cannot_start(monkeypatch, tmp_path):
+    played = []
+
+    async def _fake_generate_speech(text, output_file, config):
+        with open(output_file, "wb") as handle:
+            handle.write(b"mp3")
+
+    monkeypatch.setattr(surf.TTSHandler, "_find_streaming_player", staticmethod(lambda: [str(tmp_path / "no-player")]))
+    monkeypatch.setattr(surf.TTSHandler, "generate_speech", staticmethod(_fake_generate_speech))
+    monkeypatch.setattr(surf.TTSHandler, "play_audio", staticmethod(played.append))
+    target = tmp_path / "post.mp3"
+
+    saved = surf.TTSHandler.run_tts("Post", "Hello", _FakeConfig(), speak=True, save_path=str(target))
+
+    assert saved == str(target)
+    assert played == [str(target)]
+    assert target.read_bytes() == b"mp3"
+
+
+def test_failed_streaming_synthesis_stops_player_and_removes_partial_file(monkeypatch, tmp_path):
+    players = []
+    real_popen = surf.subprocess.Popen
+
+    class _BrokenCommunicate:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def stream(self):
+            yield {"type": "audio", "data": b"partial"}
+            raise RuntimeError("tts backend down")
+
+    def _popen(*args, **kwargs):
+        players.append(real_popen(*args, **kwargs))
+        return players[-1]
+
+    monkeypatch.setitem(sys.modules, "edge_tts", types.SimpleNamespace(Communicate=_BrokenCommunicate))
+    monkeypatch.setattr(surf.subprocess, "Popen", _popen)
+    monkeypatch.setattr(
+        surf.TTSHandler,
+        "_find_streaming_player",
+        staticmethod(lambda: [sys.executable, "-c", "import time; time.sleep(30)"]),
+    )
+    target = tmp_path / "post.mp3"
+
+    assert surf.TTSHandler.run_tts("Post", "Hello", _FakeConfig(), speak=True, save_path=str(target)) is None
+    assert players[0].returncode is not None
+    assert not target.exists()
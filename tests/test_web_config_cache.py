@@ -0,0 +1,43 @@
+import os
+
+import surf_web
+
+
+def test_get_config_reuses_parsed_config_until_file_changes(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[LLM]\nprovider = first\n", encoding="utf-8")
+    monkeypatch.setattr(surf_web, "_get_default_config_path", lambda: str(config_path))
+    monkeypatch.setattr(surf_web, "_CONFIG_CACHE", {"key": None, "config": None, "dirs_for": None, "dirs": None})
+
+    first = surf_web.get_config()
+    second = surf_web.get_config()
+
+    config_path.write_text("[LLM]\nprovider = second\n", encoding="utf-8")
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    third = surf_web.get_config()
+
+    assert first is second
+    assert first.llm_provider == "first"
+    assert third is not first
+    assert third.llm_provider == "second"
+
+
+def test_default_dirs_follow_the_loaded_config(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[Output]\nmd_dir = first\n", encoding="utf-8")
+    monkeypatch.setattr(surf_web, "_get_default_config_path", lambda: str(config_path))
+    monkeypatch.setattr(surf_web, "_CONFIG_CACHE", {"key": None, "config": None, "dirs_for": None, "dirs": None})
+
+    first = surf_web._default_dirs(surf_web.get_config())
+    again = surf_web._default_dirs(surf_web.get_config())
+
+    config_path.write_text("[Output]\nmd_dir = second\n", encoding="utf-8")
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    changed = surf_web._default_dirs(surf_web.get_config())
+
+    assert again is first
+    assert first["md"].endswith("first")
+    assert changed["md"].endswith("second")
+    assert changed["pdf"].endswith("pdf")
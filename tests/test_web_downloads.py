@@ -0,0 +1,98 @@
+import os
+
+import surf_web
+
+
+def test_download_serves_indexed_saved_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(surf_web, "_FILE_INDEX", {})
+    saved = tmp_path / "nested" / "post.md"
+    saved.parent.mkdir()
+    saved.write_text("# Post\n", encoding="utf-8")
+    surf_web._remember_saved_file(str(saved))
+
+    response = surf_web.app.test_client().get("/download/post.md")
+
+    assert response.status_code == 200
+    assert response.data == b"# Post\n"
+    assert "attachment" in response.headers["Content-Disposition"]
+
+
+def test_download_revalidates_unchanged_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(surf_web, "_FILE_INDEX", {})
+    saved = tmp_path / "talk.mp3"
+    saved.write_bytes(b"ID3" + b"\0" * 64)
+    surf_web._remember_saved_file(str(saved))
+    client = surf_web.app.test_client()
+
+    first = client.get("/download/talk.mp3")
+    by_etag = client.get("/download/talk.mp3", headers={"If-None-Match": first.headers["ETag"]})
+    by_date = client.get("/download/talk.mp3", headers={"If-Modified-Since": first.headers["Last-Modified"]})
+
+    assert first.status_code == 200
+    assert by_etag.status_code == 304
+    assert by_date.status_code == 304
+    assert by_etag.data == b""
+
+
+def test_download_indexes_output_directories_on_miss(monkeypatch, tmp_path):
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    (notes / "older.md").write_text("# Older\n", encoding="utf-8")
+    stale = tmp_path / "gone.md"
+    monkeypatch.setattr(surf_web, "_FILE_INDEX", {"older.md": str(stale)})
+    monkeypatch.setattr(surf_web, "_FILE_INDEX_SCANS", {})
+    monkeypatch.setattr(surf_web, "_default_dirs", lambda config: {"md": str(notes)})
+
+    response = surf_web.app.test_client().get("/download/older.md")
+
+    assert response.status_code == 200
+    assert response.data == b"# Older\n"
+    assert surf_web._FILE_INDEX["older.md"] == str(notes / "older.md")
+
+
+def test_download_misses_rescan_only_changed_output_directories(monkeypatch, tmp_path):
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    (notes / "first.md").write_text("# First\n", encoding="utf-8")
+    scans = []
+    real_scandir = surf_web.os.scandir
+    monkeypatch.setattr(surf_web.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+    monkeypatch.setattr(surf_web, "_FILE_INDEX", {})
+    monkeypatch.setattr(surf_web, "_FILE_INDEX_SCANS", {})
+    monkeypatch.setattr(surf_web, "_default_dirs", lambda config: {"md": str(notes)})
+    client = surf_web.app.test_client()
+
+    misses = [client.get(f"/download/probe-{index}.md").status_code for index in range(3)]
+    (notes / "first.md").unlink()
+    (notes / "second.md").write_text("# Second\n", encoding="utf-8")
+    os.utime(notes, ns=(0, os.stat(notes).st_mtime_ns + 1_000_000_000))
+    found = client.get("/download/second.md")
+
+    assert misses == [404, 404, 404]
+    assert len(scans) == 2
+    assert found.status_code == 200
+    assert "first.md" not in surf_web._FILE_INDEX
+
+
+def test_download_rejects_path_traversal(monkeypatch, tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret", encoding="utf-8")
+    monkeypatch.setattr(surf_web, "_FILE_INDEX", {})
+    monkeypatch.setattr(surf_web, "_default_dirs", lambda config: {"md": str(tmp_path / "notes")})
+    client = surf_web.app.test_client()
+
+    for path in ("/download/..%2Fsecret.txt", "/download/..", "/download/%2E%2E%2Fsecret.txt"):
+        response = client.get(path)
+        assert response.status_code == 404
+        assert b"secret" != response.data
+
+
+def test_download_never_serves_files_from_the_working_directory(monkeypatch, tmp_path):
+    (tmp_path / "config.ini").write_text("[LLM.openai]\napi_key = sk-secret\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(surf_web, "_FILE_INDEX", {})
+
+    response = surf_web.app.test_client().get("/download/config.ini")
+
+    assert response.status_code == 404
+    assert b"sk-secret" not in response.data
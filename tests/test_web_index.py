@@ -0,0 +1,97 @@
+import gzip
+import re
+
+import surf_web
+
+
+def test_index_reuses_rendered_page_and_honors_etag(monkeypatch):
+    renders = []
+    template = surf_web._get_index_template()
+    original_render = template.render
+
+    def _counting_render(**context):
+        renders.append(context)
+        return original_render(**context)
+
+    monkeypatch.setattr(surf_web, "_INDEX_PAGE", None)
+    monkeypatch.setattr(template, "render", _counting_render)
+    client = surf_web.app.test_client()
+
+    first = client.get("/")
+    second = client.get("/", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert first.status_code == 200
+    assert b"Surf v" in first.data
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert second.status_code == 304
+    assert len(renders) == 1
+
+
+def test_index_rerenders_when_context_changes(monkeypatch):
+    monkeypatch.setattr(surf_web, "_INDEX_PAGE", None)
+    client = surf_web.app.test_client()
+
+    first = client.get("/")
+    monkeypatch.setattr(surf_web, "get_runtime_version", lambda: "9.9.9.9")
+    second = client.get("/")
+
+    assert b"Surf v9.9.9.9" in second.data
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+
+def test_index_serves_precompressed_gzip(monkeypatch):
+    monkeypatch.setattr(surf_web, "_INDEX_PAGE", None)
+    client = surf_web.app.test_client()
+
+    plain = client.get("/")
+    compressed = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert gzip.decompress(compressed.data) == plain.data
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+
+def test_extract_index_assets_minifies_style_and_script_into_linked_files(monkeypatch):
+    monkeypatch.setattr(surf_web, "_INDEX_ASSETS", {})
+    template = (
+        "<style>\n  /* layout */\n  .card {\n    color: red;\n    margin: 0 auto;\n  }\n</style>\n"
+        "<script>\n    // setup\n    const a = 1;\n\n    if (a) {\n        go('x');\n    }\n</script>"
+    )
+
+    page = surf_web._extract_index_assets(template)
+
+    css_name = next(name for name in surf_web._INDEX_ASSETS if name.endswith(".css"))
+    js_name = next(name for name in surf_web._INDEX_ASSETS if name.endswith(".js"))
+    assert page == (
+        f'<link rel="stylesheet" href="{{{{ root_path }}}}/assets/{css_name}">\n'
+        f'<script src="{{{{ root_path }}}}/assets/{js_name}"></script>'
+    )
+    assert surf_web._INDEX_ASSETS[css_name][0] == b".card{color:red;margin:0 auto}"
+    assert surf_web._INDEX_ASSETS[js_name][0] == b"const a = 1;\nif (a) {\ngo('x');\n}"
+
+
+def test_minify_html_collapses_indentation_but_keeps_preformatted_content():
+    html = "<div>\n    <!-- note -->\n    <span>a</span> <b>b</b>\n\n    <textarea>\n  keep\n</textarea>\n</div>\n"
+
+    assert surf_web._minify_html(html) == "<div>\n<span>a</span> <b>b</b>\n<textarea>\n  keep\n</textarea>\n</div>"
+
+
+def test_index_links_immutable_assets(monkeypatch):
+    monkeypatch.setattr(surf_web, "_INDEX_PAGE", None)
+    client = surf_web.app.test_client()
+
+    page = client.get("/").data.decode("utf-8")
+    script_url = re.search(r'<script src="([^"]+)"', page).group(1)
+    script = client.get(script_url)
+
+    assert "<style>" not in page
+    assert "\n    <" not in page
+    assert re.search(r'<link rel="stylesheet" href="/assets/surf\.\w+\.css">', page)
+    assert script.status_code == 200
+    assert script.mimetype == "text/javascript"
+    assert b"API_BASE" in script.data
+    assert "immutable" in script.headers["Cache-Control"]
+    assert client.get(script_url, headers={"If-None-Match": script.headers["ETag"]}).status_code == 304
+    assert client.get("/assets/missing.js").status_code == 404
@@ -0,0 +1,60 @@
+import gzip
+import json
+from decimal import Decimal
+
+import pytest
+
+import surf_web
+
+
+def test_orjson_provider_round_trips_and_falls_back():
+    orjson = pytest.importorskip("orjson")
+    provider = surf_web._OrjsonProvider(surf_web.app, orjson)
+
+    encoded = provider.dumps({"title": "标题", 1: [True, None]})
+
+    assert provider.loads(encoded) == {"title": "标题", "1": [True, None]}
+    assert provider.loads(provider.dumps({"price": Decimal("1.50")})) == {"price": "1.50"}
+
+
+def test_app_uses_orjson_provider_when_installed():
+    pytest.importorskip("orjson")
+
+    assert isinstance(surf_web.app.json, surf_web._OrjsonProvider)
+
+
+def test_large_api_responses_are_gzipped_for_accepting_clients(monkeypatch):
+    def _process(data, translate_sync=False, progress=None, **kwargs):
+        return {"title": "Post", "markdown": "body " * 1000, "metadata": {}}, "raw", False
+
+    monkeypatch.setattr(surf_web, "_process_web_request", _process)
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/post", "lang": "raw"}
+
+    plain = client.post("/api/process", json=payload)
+    compressed = client.post("/api/process", json=payload, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+
+
+def test_orjson_provider_builds_json_responses_from_bytes():
+    orjson = pytest.importorskip("orjson")
+    provider = surf_web._OrjsonProvider(surf_web.app, orjson)
+
+    with surf_web.app.app_context():
+        response = provider.response({"title": "标题"})
+        fallback = provider.response({"price": Decimal("1.50")})
+        positional = provider.response(1, 2)
+        keywords = provider.response(ok=True)
+        empty = provider.response()
+        with pytest.raises(TypeError):
+            provider.response(1, ok=True)
+
+    assert response.mimetype == "application/json"
+    assert response.get_data() == '{"title":"标题"}\n'.encode("utf-8")
+    assert json.loads(fallback.get_data()) == {"price": "1.50"}
+    assert positional.get_json() == [1, 2]
+    assert keywords.get_json() == {"ok": True}
+    assert empty.get_json() is None
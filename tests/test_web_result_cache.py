@@ -0,0 +1,251 @@
+import json
+import os
+import threading
+import time
+
+import surf_web
+
+
+def _counting_processor(calls):
+    def _process(data, translate_sync=False, progress=None, **kwargs):
+        calls.append(data["url"])
+        return {"title": "Post", "markdown": "body", "metadata": {}}, "raw", False
+
+    return _process
+
+
+def test_process_url_serves_repeat_requests_from_cache(monkeypatch):
+    calls = []
+    monkeypatch.setattr(surf_web, "_process_web_request", _counting_processor(calls))
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/post", "lang": "raw"}
+
+    first = client.post("/api/process", json=payload).get_json()
+    second = client.post("/api/process", json=payload).get_json()
+    client.post("/api/process", json={**payload, "lang": "both"})
+
+    assert first == second
+    assert second["success"] is True
+    assert calls == ["https://example.com/post", "https://example.com/post"]
+
+
+def test_cached_result_whose_page_html_expired_is_reprocessed(monkeypatch):
+    calls = []
+
+    def _process(data, translate_sync=False, progress=None, **kwargs):
+        calls.append(data["url"])
+        token = surf_web._stash_source_html("<html>page</html>")
+        return {"title": "Post", "markdown": "body", "metadata": {"html_token": token}}, "raw", False
+
+    monkeypatch.setattr(surf_web, "_process_web_request", _process)
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/post", "lang": "raw"}
+
+    first = client.post("/api/process", json=payload).get_json()
+    surf_web._SAVE_STASH.pop(first["metadata"]["html_token"])
+    second = client.post("/api/process", json=payload).get_json()
+
+    assert len(calls) == 2
+    assert second["metadata"]["html_token"] != first["metadata"]["html_token"]
+
+
+def test_process_url_cache_misses_after_config_changes(monkeypatch, tmp_path):
+    calls = []
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[Translation]\ntarget_language = zh\n", encoding="utf-8")
+    monkeypatch.setattr(surf_web, "_get_default_config_path", lambda: str(config_path))
+    monkeypatch.setattr(surf_web, "_CONFIG_CACHE", {"key": None, "config": None, "dirs_for": None, "dirs": None})
+    monkeypatch.setattr(surf_web, "_process_web_request", _counting_processor(calls))
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/post", "lang": "raw"}
+
+    client.post("/api/process", json=payload)
+    client.post("/api/process", json=payload)
+    config_path.write_text("[Translation]\ntarget_language = ja\n", encoding="utf-8")
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    client.post("/api/process", json=payload)
+
+    assert len(calls) == 2
+
+
+def test_process_url_nocache_bypasses_cache(monkeypatch):
+    calls = []
+    monkeypatch.setattr(surf_web, "_process_web_request", _counting_processor(calls))
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/post", "lang": "raw"}
+
+    client.post("/api/process", json=payload)
+    client.post("/api/process?nocache=1", json=payload)
+    client.post("/api/process", json={**payload, "nocache": True})
+
+    assert len(calls) == 3
+
+
+def test_process_stream_reports_stages_then_result(monkeypatch):
+    def _process(data, translate_sync=False, progress=None, **kwargs):
+        progress("fetch")
+        progress("extract")
+        return {"title": "Post", "markdown": "body", "metadata": {}}, "raw", False
+
+    monkeypatch.setattr(surf_web, "_process_web_request", _process)
+    client = surf_web.app.test_client()
+
+    response = client.post("/api/process_stream", json={"url": "https://example.com/post", "lang": "raw"})
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith("data: ")
+    ]
+
+    assert response.mimetype == "text/event-stream"
+    assert [event["stage"] for event in events] == ["fetch", "extract", "result"]
+    assert events[-1]["result"]["success"] is True
+    assert events[-1]["result"]["title"] == "Post"
+
+
+def test_process_stream_sends_heartbeats_and_gives_up_at_the_timeout(monkeypatch):
+    release = threading.Event()
+
+    def _stuck_process(data, translate_sync=False, progress=None, **kwargs):
+        release.wait(timeout=5)
+        return {"title": "Post", "markdown": "body", "metadata": {}}, "raw", False
+
+    monkeypatch.setattr(surf_web, "_process_web_request", _stuck_process)
+    monkeypatch.setattr(surf_web, "_PROCESS_STREAM_HEARTBEAT_SECONDS", 0.02)
+    client = surf_web.app.test_client()
+
+    body = client.post(
+        "/api/process_stream", json={"url": "https://example.com/stuck", "timeout": 0.1}
+    ).get_data(as_text=True)
+    release.set()
+    result = json.loads(body.rstrip().splitlines()[-1][len("data: "):])
+
+    assert ": keep-alive" in body
+    assert result["stage"] == "result"
+    assert result["result"]["timed_out"] is True
+
+
+def test_process_url_returns_503_when_fetch_slots_are_exhausted(monkeypatch):
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(surf_web, "_HTTP_FETCH_SLOTS", slots)
+    monkeypatch.setattr(surf_web, "_FETCH_SLOT_TIMEOUT", 0.01)
+
+    def _should_not_fetch(*args, **kwargs):
+        raise AssertionError("fetch must wait for a free slot")
+
+    monkeypatch.setattr(surf_web.Fetcher, "fetch", _should_not_fetch)
+    response = surf_web.app.test_client().post(
+        "/api/process", json={"url": "https://example.com/post", "lang": "raw"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(surf_web._RETRY_AFTER_SECONDS)
+    assert response.get_json()["success"] is False
+
+
+def test_process_url_reuses_fetched_page_across_language_modes(monkeypatch):
+    fetches = []
+
+    def _fetch(url, **kwargs):
+        fetches.append(url)
+        return "<html><head><title>Post</title></head><body><article><p>" + "Body text. " * 40 + "</p></article></body></html>"
+
+    monkeypatch.setattr(surf_web.Fetcher, "fetch", _fetch)
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/post", "lang": "raw", "proxy": "no"}
+
+    client.post("/api/process", json=payload)
+    client.post("/api/process", json={**payload, "no_front_matter": True})
+    client.post("/api/process?nocache=1", json=payload)
+
+    assert fetches == ["https://example.com/post", "https://example.com/post"]
+
+
+def test_concurrent_fetches_of_the_same_page_share_one_request(monkeypatch):
+    release = threading.Event()
+    joined = threading.Event()
+    calls = []
+    results = []
+
+    class _InFlight(dict):
+        def get(self, key, default=None):
+            value = super().get(key, default)
+            if value is not None:
+                joined.set()
+            return value
+
+    monkeypatch.setattr(surf_web, "_FETCH_IN_FLIGHT", _InFlight())
+
+    def _slow_fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "<html>page</html>", None
+
+    def _request():
+        results.append(surf_web._fetch_page_cached(("https://example.com/post",), _slow_fetch, use_cache=False))
+
+    threads = [threading.Thread(target=_request) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    joined.wait(timeout=5)
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == [1]
+    assert results == [("<html>page</html>", None)] * 2
+    assert surf_web._FETCH_IN_FLIGHT == {}
+
+
+def test_process_url_times_out_and_caches_the_late_result(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def _slow_process(data, translate_sync=False, progress=None, **kwargs):
+        calls.append(data["url"])
+        release.wait(timeout=5)
+        return {"title": "Post", "markdown": "body", "metadata": {}}, "raw", False
+
+    monkeypatch.setattr(surf_web, "_process_web_request", _slow_process)
+    client = surf_web.app.test_client()
+    payload = {"url": "https://example.com/slow", "lang": "raw"}
+
+    timed_out = client.post("/api/process", json={**payload, "timeout": 0.05})
+    release.set()
+    for _ in range(100):
+        if surf_web._RESULT_CACHE:
+            break
+        time.sleep(0.01)
+    retried = client.post("/api/process", json=payload)
+
+    assert timed_out.status_code == 504
+    assert timed_out.get_json()["success"] is False
+    assert retried.get_json()["success"] is True
+    assert calls == ["https://example.com/slow"]
+
+
+def test_process_timeout_drops_queued_work_and_is_capped(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def _slow_process(data, translate_sync=False, progress=None, **kwargs):
+        calls.append(data["url"])
+        release.wait(timeout=5)
+        return {"title": "Post", "markdown": "body", "metadata": {}}, "raw", False
+
+    executor = surf_web.ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(surf_web, "_PROCESS_EXECUTOR", executor)
+    monkeypatch.setattr(surf_web, "_process_web_request", _slow_process)
+    client = surf_web.app.test_client()
+
+    running = client.post("/api/process", json={"url": "https://example.com/running", "timeout": 0.05})
+    queued = client.post("/api/process", json={"url": "https://example.com/queued", "timeout": 0.05})
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert running.status_code == 504
+    assert queued.status_code == 504
+    assert calls == ["https://example.com/running"]
+    assert surf_web._request_process_timeout({"timeout": 1e9}) == surf_web._PROCESS_TIMEOUT_SECONDS
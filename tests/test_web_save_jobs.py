@@ -0,0 +1,104 @@
+import threading
+import time
+
+import surf_web
+
+
+def test_finished_save_job_drops_its_payload(monkeypatch, tmp_path):
+    monkeypatch.setattr(surf_web, "_SAVE_JOBS", {})
+    job_id = "job-1"
+    surf_web._store_save_job(
+        job_id,
+        {
+            "status": "pending",
+            "created_at": time.time(),
+            "updated_at": time.time(),
+            "data": {
+                "fileType": "md",
+                "saveDir": str(tmp_path),
+                "data": {"title": "Post", "markdown": "# Post\n", "metadata": {"add_front_matter": False}},
+            },
+        },
+    )
+
+    surf_web._run_web_save_job(job_id)
+
+    job = surf_web._get_save_job(job_id)
+    assert job["status"] == "done"
+    assert "data" not in job
+    assert (tmp_path / "Post.md").exists()
+
+
+def test_storing_a_job_prunes_long_finished_jobs(monkeypatch):
+    stale = time.time() - surf_web._JOB_RETENTION_SECONDS - 1
+    monkeypatch.setattr(
+        surf_web,
+        "_SAVE_JOBS",
+        {
+            "old-done": {"status": "done", "updated_at": stale},
+            "old-running": {"status": "running", "updated_at": stale},
+        },
+    )
+
+    surf_web._store_save_job("new", {"status": "pending", "updated_at": time.time()})
+
+    assert set(surf_web._SAVE_JOBS) == {"old-running", "new"}
+
+
+def test_save_accepts_a_result_token_instead_of_the_result(tmp_path):
+    token = surf_web._stash_for_save(
+        {"title": "Token Post", "markdown": "# Token Post\n", "metadata": {"add_front_matter": False}}
+    )
+    client = surf_web.app.test_client()
+
+    saved = client.post("/api/save", json={"fileType": "md", "saveDir": str(tmp_path), "result_token": token})
+    expired = client.post("/api/save", json={"fileType": "md", "saveDir": str(tmp_path), "result_token": "gone"})
+
+    assert saved.get_json()["success"] is True
+    assert (tmp_path / "Token Post.md").read_text(encoding="utf-8").startswith("# Token Post")
+    assert expired.get_json()["success"] is False
+
+
+def test_saves_waiting_on_translations_do_not_starve_them(monkeypatch, tmp_path):
+    save_pool = surf_web.ThreadPoolExecutor(max_workers=2)
+    translation_pool = surf_web.ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(surf_web, "_WEB_EXECUTOR", save_pool)
+    monkeypatch.setattr(surf_web, "_TRANSLATION_EXECUTOR", translation_pool)
+    monkeypatch.setattr(surf_web, "_SAVE_JOBS", {})
+    monkeypatch.setattr(surf_web, "_TRANSLATION_JOBS", {})
+    saves_waiting = []
+    changed = threading.Condition()
+    real_wait = surf_web._wait_for_translation_and_get_result
+
+    def _wait(job_id, timeout=300, poll_interval=2):
+        with changed:
+            saves_waiting.append(job_id)
+            changed.notify_all()
+        return real_wait(job_id, timeout=3, poll_interval=0.01)
+
+    def _translate(job_id):
+        # Finish only once every save worker is busy waiting on a translation.
+        with changed:
+            if not changed.wait_for(lambda: len(saves_waiting) >= 2, timeout=1):
+                return
+        job = surf_web._get_translation_job(job_id)
+        result = {**job["source"], "markdown": "# Translated\n"}
+        surf_web._store_translation_job(job_id, {**job, "status": "done", "result": result})
+
+    monkeypatch.setattr(surf_web, "_wait_for_translation_and_get_result", _wait)
+    monkeypatch.setattr(surf_web, "_run_web_translation_job", _translate)
+    saves = []
+    for index in range(3):
+        source = {"title": f"Post {index}", "markdown": "# Post\n", "metadata": {"add_front_matter": False}}
+        translation_job_id = surf_web._enqueue_web_translation_job(source, None, "trans")
+        saves.append(
+            surf_web._enqueue_web_save_job(
+                {"fileType": "md", "saveDir": str(tmp_path), "translation_job_id": translation_job_id}
+            )
+        )
+
+    save_pool.shutdown(wait=True)
+    translation_pool.shutdown(wait=True)
+
+    assert [surf_web._get_save_job(job_id)["status"] for job_id in saves] == ["done"] * 3
+    assert len(list(tmp_path.glob("Post *.md"))) == 3
@@ -0,0 +1,51 @@
+import socket
+import time
+
+import surf_web
+
+
+def test_open_browser_waits_for_listening_socket(monkeypatch):
+    opened = []
+    monkeypatch.setattr(surf_web.webbrowser, "open", opened.append)
+
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        surf_web._open_browser_when_ready("0.0.0.0", port, f"http://127.0.0.1:{port}", timeout=2)
+
+    assert opened == [f"http://127.0.0.1:{port}"]
+
+
+def test_open_browser_polls_until_server_starts_listening(monkeypatch):
+    opened = []
+    attempts = []
+    real_connect = socket.create_connection
+
+    def _connect(address, timeout=None):
+        attempts.append(timeout)
+        if len(attempts) < 3:
+            raise ConnectionRefusedError
+        return real_connect(address, timeout=timeout)
+
+    monkeypatch.setattr(surf_web.webbrowser, "open", opened.append)
+    monkeypatch.setattr(surf_web.socket, "create_connection", _connect)
+
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+        started = time.monotonic()
+        surf_web._open_browser_when_ready("127.0.0.1", port, "http://x", timeout=2)
+        elapsed = time.monotonic() - started
+
+    assert opened == ["http://x"]
+    assert attempts == [surf_web._BROWSER_PROBE_CONNECT_TIMEOUT] * 3
+    assert elapsed < 0.5
+
+
+def test_gunicorn_bind_brackets_ipv6_hosts():
+    assert surf_web._gunicorn_bind("127.0.0.1", 18473) == "127.0.0.1:18473"
+    assert surf_web._gunicorn_bind("::", 18473) == "[::]:18473"
+    assert surf_web._gunicorn_bind("::1", 80) == "[::1]:80"
+    assert surf_web._gunicorn_bind("[::1]", 80) == "[::1]:80"
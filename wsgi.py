@@ -1,7 +1,11 @@
 """WSGI entry point for production deployment behind nginx.
 
 Usage:
-    gunicorn wsgi:app
+    gunicorn -k gthread --threads 8 wsgi:app
+    waitress-serve --threads=8 wsgi:app
+
+Keep a single worker process: translation jobs, the result cache and the
+download index live in process memory.
 """
 import os
 